@@ -2,12 +2,18 @@
 Base interfaces and utilities for code quality metrics.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Union, Tuple
 from pathlib import Path
 import subprocess
 import json
 import logging
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -64,12 +70,117 @@ class MetricResult:
             "error": self.error
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MetricResult':
+        """
+        Create a metric result from a dictionary representation.
+
+        Args:
+            data: Dictionary as produced by to_dict()
+
+        Returns:
+            MetricResult instance
+        """
+        return cls(
+            name=data["name"],
+            raw_value=data["raw_value"],
+            normalized_value=data["normalized_value"],
+            details=data.get("details"),
+            success=data.get("success", True),
+            error=data.get("error")
+        )
+
     @property
     def needs_improvement(self) -> bool:
         """Check if this metric needs improvement based on threshold."""
         return self.normalized_value < 0.95
 
 
+class MetricBatch:
+    """
+    Structure-of-arrays view over a list of metric results.
+
+    Numeric consumers that scan many metrics (aggregation, summaries)
+    pay pointer-chasing and boxed-float overhead when reading
+    `MetricResult` objects one by one. A batch stores the names,
+    normalized values and raw values as parallel arrays (NumPy arrays
+    when available, plain lists otherwise) so those scans become
+    vectorized or at least cache-friendly sequential reads.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        normalized_values: Any,
+        raw_values: Any,
+        details: List[Dict[str, Any]]
+    ):
+        """
+        Initialize a metric batch.
+
+        Args:
+            names: Metric names, parallel to the value arrays
+            normalized_values: Normalized values (array or list of floats)
+            raw_values: Raw values (array or list of floats)
+            details: Per-metric details dictionaries
+        """
+        self.names = names
+        self.normalized_values = normalized_values
+        self.raw_values = raw_values
+        self.details = details
+
+    def __len__(self) -> int:
+        """Number of metrics in the batch."""
+        return len(self.names)
+
+    @classmethod
+    def from_results(cls, results: List['MetricResult']) -> 'MetricBatch':
+        """
+        Build a batch from a list of MetricResult objects.
+
+        Args:
+            results: Metric results to convert
+
+        Returns:
+            MetricBatch with parallel arrays over the results
+        """
+        names = [result.name for result in results]
+        details = [result.details for result in results]
+        if np is not None:
+            normalized = np.fromiter(
+                (result.normalized_value for result in results),
+                dtype=np.float64, count=len(results)
+            )
+            raw = np.fromiter(
+                (float(result.raw_value) for result in results),
+                dtype=np.float64, count=len(results)
+            )
+        else:
+            normalized = [result.normalized_value for result in results]
+            raw = [float(result.raw_value) for result in results]
+        return cls(names, normalized, raw, details)
+
+    def count_above_threshold(self, threshold: float) -> int:
+        """
+        Count metrics meeting the threshold.
+
+        Args:
+            threshold: The threshold to compare against
+
+        Returns:
+            Number of metrics with normalized value >= threshold
+        """
+        if np is not None:
+            return int((self.normalized_values >= threshold).sum())
+        return sum(1 for value in self.normalized_values if value >= threshold)
+
+    def total_normalized(self) -> float:
+        """Sum of the normalized values."""
+        if np is not None:
+            return float(self.normalized_values.sum())
+        return sum(self.normalized_values)
+
+
 class MetricsCollector(ABC):
     """Base abstract class for all metrics collectors."""
     
@@ -83,6 +194,9 @@ class MetricsCollector(ABC):
         self.project_path = Path(project_path)
         if not self.project_path.exists():
             raise ValueError(f"Project path does not exist: {self.project_path}")
+        # Optional shared list of project .py files, injected by the
+        # MetricsManager so collectors can skip their own tree walks
+        self.project_files: Optional[Tuple[str, ...]] = None
     
     @abstractmethod
     def collect(self) -> List[MetricResult]:
@@ -113,9 +227,12 @@ class MetricsCollector(ABC):
         """
         try:
             logger.debug(f"Running command: {' '.join(cmd)}")
+            # capture_output drains stdout and stderr concurrently, so a
+            # tool dumping a large stacktrace can't block on a full pipe
             result = subprocess.run(
                 cmd,
                 cwd=str(self.project_path),
+                stdin=subprocess.DEVNULL,
                 capture_output=capture_output,
                 text=True,
                 check=check
@@ -128,6 +245,73 @@ class MetricsCollector(ABC):
             logger.exception(f"Error running command: {e}")
             return -1, "", str(e)
 
+    def run_command_bytes(
+        self,
+        cmd: List[str],
+        check: bool = False
+    ) -> Tuple[int, bytes, bytes]:
+        """
+        Run a shell command and return raw bytes output.
+
+        Skips the UTF-8 decode of the captured output, which matters for
+        commands emitting large JSON blobs that are parsed as bytes anyway.
+
+        Args:
+            cmd: Command to run as a list of strings
+            check: Whether to raise an exception on non-zero exit
+
+        Returns:
+            Tuple of (return_code, stdout, stderr) with bytes output
+        """
+        try:
+            logger.debug(f"Running command: {' '.join(cmd)}")
+            result = subprocess.run(
+                cmd,
+                cwd=str(self.project_path),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                check=check
+            )
+            return result.returncode, result.stdout, result.stderr
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Command failed: {e}")
+            return e.returncode, e.stdout, e.stderr
+        except Exception as e:
+            logger.exception(f"Error running command: {e}")
+            return -1, b"", str(e).encode()
+
+
+def run_collectors_parallel(
+    callables: List[Callable[[], List['MetricResult']]]
+) -> List['MetricResult']:
+    """
+    Run metric helper callables concurrently and concatenate their results.
+
+    Each helper blocks on an external tool, so threads overlap the
+    subprocess latencies. Results keep the order of the callables, and a
+    failing helper contributes an error metric instead of aborting the rest.
+
+    Args:
+        callables: Zero-argument helpers, each returning a list of MetricResult
+
+    Returns:
+        Concatenated list of MetricResult objects
+    """
+    if len(callables) <= 1:
+        return [metric for fn in callables for metric in fn()]
+
+    metrics = []
+    with ThreadPoolExecutor(max_workers=len(callables)) as executor:
+        futures = [(fn, executor.submit(fn)) for fn in callables]
+        for fn, future in futures:
+            try:
+                metrics.extend(future.result())
+            except Exception as e:
+                logger.error(f"Error in {fn.__name__}: {e}")
+                metrics.append(create_error_metric(fn.__name__, str(e)))
+
+    return metrics
+
 
 def normalize_value(
     value: float,
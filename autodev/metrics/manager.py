@@ -1,12 +1,32 @@
 """
 Metrics manager for aggregating and prioritizing code quality metrics.
 """
+import functools
+import hashlib
+import io
 import logging
+import pickle
+import re
+import shutil
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set, Type
 import json
 
-from autodev.metrics.base import MetricsCollector, MetricResult
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from autodev.metrics.base import MetricBatch, MetricsCollector, MetricResult
 from autodev.metrics.complexity import ComplexityMetricsCollector
 from autodev.metrics.style import StyleMetricsCollector
 from autodev.metrics.documentation import DocumentationMetricsCollector
@@ -17,144 +37,382 @@ from autodev.metrics.normalizer import aggregate_metrics, apply_threshold
 
 logger = logging.getLogger(__name__)
 
+# Directories excluded from the shared project file walk
+_SKIP_DIRS = {".git", ".venv", "venv", "__pycache__", ".autodev_cache"}
+
+
+# External scanners whose upgrades should invalidate cached metrics
+_CACHED_TOOLS = ("pylint", "flake8", "black", "bandit", "safety", "interrogate", "pydocstyle")
+
+
+@functools.lru_cache(maxsize=1)
+def _tool_fingerprint() -> bytes:
+    """
+    Fingerprint the installed scanner binaries for cache keying.
+
+    Hashing each tool's resolved path and mtime means a tool upgrade (or
+    install/removal) changes the cache key and stale results are never
+    served, without spawning a --version subprocess per tool.
+
+    Returns:
+        Digest bytes covering the scanner executables
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for tool in _CACHED_TOOLS:
+        tool_path = shutil.which(tool)
+        if tool_path:
+            hasher.update(f"{tool}:{tool_path}:{Path(tool_path).stat().st_mtime_ns}".encode())
+        else:
+            hasher.update(f"{tool}:missing".encode())
+    return hasher.digest()
+
+
+class _LazyCollectorMap(Mapping):
+    """
+    Dict-like view over the collector registry that instantiates
+    collectors on first access, so only the collectors actually used
+    pay their construction cost.
+    """
+
+    def __init__(self, manager: 'MetricsManager'):
+        self._manager = manager
+
+    def __getitem__(self, name: str) -> MetricsCollector:
+        if name not in self._manager._COLLECTOR_CLASSES:
+            raise KeyError(name)
+        return self._manager._get_collector(name)
+
+    def __iter__(self):
+        return iter(self._manager._COLLECTOR_CLASSES)
+
+    def __len__(self) -> int:
+        return len(self._manager._COLLECTOR_CLASSES)
+
 
 class MetricsManager:
     """Manager for collecting, aggregating, and prioritizing code quality metrics."""
-    
-    def __init__(self, project_path: str, threshold: float = 0.95):
+
+    # Registry of available collectors; instances are created lazily
+    _COLLECTOR_CLASSES: Dict[str, Type[MetricsCollector]] = {
+        "complexity": ComplexityMetricsCollector,
+        "style": StyleMetricsCollector,
+        "documentation": DocumentationMetricsCollector,
+        "coverage": CoverageMetricsCollector,
+        "security": SecurityMetricsCollector
+    }
+
+    def __init__(self, project_path: str, threshold: float = 0.95, use_cache: bool = False):
         """
         Initialize the metrics manager.
-        
+
         Args:
             project_path: Path to the project root
             threshold: Target threshold for all metrics (0-1)
+            use_cache: Whether to reuse on-disk results when sources are unchanged
         """
         self.project_path = Path(project_path).resolve()
         self.threshold = threshold
-        self.collectors = self._initialize_collectors()
+        self.use_cache = use_cache
+        self.cache_dir = self.project_path / ".autodev_cache"
+        self._collectors: Dict[str, MetricsCollector] = {}
+        self._python_files: Optional[tuple] = None
+        self.collectors = _LazyCollectorMap(self)
         self.metrics_cache = {}
         self.aggregated_metrics = None
-    
-    def _initialize_collectors(self) -> Dict[str, MetricsCollector]:
+
+        # Map metric-name patterns to advice generators, with a compiled
+        # alternation so matching is a single regex scan per recommendation
+        self._advice_generators = {
+            "cyclomatic_complexity": self._get_complexity_advice,
+            "maintainability_index": self._get_maintainability_advice,
+            "comment_density": self._get_comment_advice,
+            "pylint_score": self._get_linting_advice,
+            "flake8_violations": self._get_linting_advice,
+            "black_compliance": self._get_formatting_advice,
+            "docstring": self._get_documentation_advice,
+            "coverage": self._get_coverage_advice,
+            "test_count": self._get_testing_advice,
+            "test_density": self._get_testing_advice,
+            "security_score": self._get_security_advice,
+            "critical_security_issues": self._get_security_advice,
+            "dependency_vulnerabilities": self._get_dependency_advice
+        }
+        self._advice_regex = re.compile(
+            "|".join(re.escape(pattern) for pattern in self._advice_generators)
+        )
+
+    def _cache_key(self) -> str:
         """
-        Initialize metrics collectors.
-        
+        Compute a cache key from the project's Python files.
+
+        The key hashes each file's path, mtime and size, so any source
+        change produces a new key and stale cache entries are simply
+        never looked up again.
+
         Returns:
-            Dictionary of collector name to collector instance
+            Hex digest identifying the current state of the source tree
         """
-        collectors = {
-            "complexity": ComplexityMetricsCollector(self.project_path),
-            "style": StyleMetricsCollector(self.project_path),
-            "documentation": DocumentationMetricsCollector(self.project_path),
-            "coverage": CoverageMetricsCollector(self.project_path),
-            "security": SecurityMetricsCollector(self.project_path)
-        }
-        
-        return collectors
+        hasher = hashlib.blake2b(digest_size=16)
+        for path in sorted(self.project_path.rglob("*.py")):
+            stat = path.stat()
+            hasher.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        hasher.update(_tool_fingerprint())
+        return hasher.hexdigest()
+
+    def _cache_path(self, collector_name: str, key: str) -> Path:
+        """Build the cache file path for a collector and tree-state key."""
+        # msgpack is a compact, portable binary format and its C codec
+        # beats pickle on the mostly-numeric MetricResult payloads
+        extension = "msgpack" if msgpack is not None else "pkl"
+        return self.cache_dir / f"{collector_name}_{key}.{extension}"
+
+    def _load_cached_metrics(self, collector_name: str, key: str) -> Optional[List[MetricResult]]:
+        """
+        Load cached metric results for a collector, if present.
+
+        Args:
+            collector_name: Name of the collector
+            key: Cache key for the current source tree state
+
+        Returns:
+            Cached list of MetricResult objects, or None on a cache miss
+        """
+        cache_path = self._cache_path(collector_name, key)
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, 'rb') as f:
+                if msgpack is not None:
+                    return [
+                        MetricResult.from_dict(data)
+                        for data in msgpack.unpackb(f.read(), raw=False)
+                    ]
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load cached metrics for {collector_name}: {e}")
+            return None
+
+    def _store_cached_metrics(self, collector_name: str, key: str, metrics: List[MetricResult]) -> None:
+        """
+        Store metric results for a collector on disk.
+
+        Args:
+            collector_name: Name of the collector
+            key: Cache key for the current source tree state
+            metrics: Metric results to store
+        """
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            with open(self._cache_path(collector_name, key), 'wb') as f:
+                if msgpack is not None:
+                    f.write(msgpack.packb(
+                        [metric.to_dict() for metric in metrics], use_bin_type=True
+                    ))
+                else:
+                    pickle.dump(metrics, f)
+        except Exception as e:
+            logger.warning(f"Failed to cache metrics for {collector_name}: {e}")
     
-    def collect_all_metrics(self) -> Dict[str, List[MetricResult]]:
+    def _get_collector(self, name: str) -> MetricsCollector:
+        """
+        Get a collector instance, creating it on first use.
+
+        Args:
+            name: Name of the collector in the registry
+
+        Returns:
+            The collector instance
+        """
+        if name not in self._collectors:
+            collector = self._COLLECTOR_CLASSES[name](self.project_path)
+            collector.project_files = self.python_files
+            self._collectors[name] = collector
+        return self._collectors[name]
+
+    @property
+    def python_files(self) -> tuple:
+        """
+        The project's Python files, walked once and shared.
+
+        Each external tool would otherwise re-walk the tree itself; the
+        cached list lets collectors pass explicit file arguments instead.
+
+        Returns:
+            Tuple of .py file paths as strings
+        """
+        if self._python_files is None:
+            self._python_files = tuple(
+                str(path) for path in self.project_path.rglob("*.py")
+                if not any(part in _SKIP_DIRS for part in path.parts)
+            )
+        return self._python_files
+
+
+    def _collect_from(self, name: str) -> List[MetricResult]:
+        """
+        Run a single collector, falling back to an empty list on errors.
+
+        Args:
+            name: Name of the collector to run
+
+        Returns:
+            List of metric results from the collector
+        """
+        logger.info(f"Collecting metrics from {name}...")
+        try:
+            metrics = self.collectors[name].collect()
+            logger.info(f"Collected {len(metrics)} metrics from {name}")
+            return metrics
+        except Exception as e:
+            logger.error(f"Error collecting metrics from {name}: {str(e)}")
+            return []
+
+    def _run_collectors(self, names: List[str], parallel: bool) -> Dict[str, List[MetricResult]]:
+        """
+        Run the given collectors, optionally in parallel.
+
+        Each collector spends most of its time blocked in subprocess calls,
+        so threads overlap the external tool invocations and wall-clock time
+        approaches that of the slowest single collector.
+
+        Args:
+            names: Names of the collectors to run
+            parallel: Whether to run collectors in a thread pool
+
+        Returns:
+            Dictionary of collector name to list of metric results
+        """
+        results = {}
+        key = None
+
+        # Serve collectors from the on-disk cache when sources are unchanged
+        if self.use_cache:
+            key = self._cache_key()
+            for name in names:
+                cached = self._load_cached_metrics(name, key)
+                if cached is not None:
+                    logger.info(f"Using cached metrics for {name}")
+                    results[name] = cached
+            names = [name for name in names if name not in results]
+
+        if not parallel or len(names) <= 1:
+            for name in names:
+                results[name] = self._collect_from(name)
+        else:
+            with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                futures = {executor.submit(self._collect_from, name): name for name in names}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+
+        if self.use_cache:
+            for name in names:
+                self._store_cached_metrics(name, key, results[name])
+
+        return results
+
+    def collect_all_metrics(self, parallel: bool = True) -> Dict[str, List[MetricResult]]:
         """
         Collect all metrics from all collectors.
-        
+
+        Args:
+            parallel: Whether to run collectors concurrently (default True)
+
         Returns:
             Dictionary of collector name to list of metric results
         """
-        all_metrics = {}
-        
-        for name, collector in self.collectors.items():
-            logger.info(f"Collecting metrics from {name}...")
-            try:
-                metrics = collector.collect()
-                all_metrics[name] = metrics
-                logger.info(f"Collected {len(metrics)} metrics from {name}")
-            except Exception as e:
-                logger.error(f"Error collecting metrics from {name}: {str(e)}")
-                all_metrics[name] = []
-        
+        all_metrics = self._run_collectors(list(self.collectors.keys()), parallel)
+
         self.metrics_cache = all_metrics
         return all_metrics
-    
-    def collect_specific_metrics(self, collectors: List[str]) -> Dict[str, List[MetricResult]]:
+
+    def collect_specific_metrics(self, collectors: List[str], parallel: bool = True) -> Dict[str, List[MetricResult]]:
         """
         Collect metrics from specific collectors.
-        
+
         Args:
             collectors: List of collector names to use
-        
+            parallel: Whether to run collectors concurrently (default True)
+
         Returns:
             Dictionary of collector name to list of metric results
         """
-        specific_metrics = {}
-        
+        known_collectors = []
         for name in collectors:
             if name not in self.collectors:
                 logger.warning(f"Collector {name} not found")
                 continue
-            
-            logger.info(f"Collecting metrics from {name}...")
-            try:
-                metrics = self.collectors[name].collect()
-                specific_metrics[name] = metrics
-                logger.info(f"Collected {len(metrics)} metrics from {name}")
-            except Exception as e:
-                logger.error(f"Error collecting metrics from {name}: {str(e)}")
-                specific_metrics[name] = []
-        
+            known_collectors.append(name)
+
+        specific_metrics = self._run_collectors(known_collectors, parallel)
+
         # Update cache with new metrics
         for name, metrics in specific_metrics.items():
             self.metrics_cache[name] = metrics
-        
+
         return specific_metrics
     
-    def aggregate_metrics(self, 
+    def get_metric_batch(self, collector_name: str) -> Optional[MetricBatch]:
+        """
+        Get a structure-of-arrays view over a collector's cached metrics.
+
+        Numeric consumers can scan the batch's parallel value arrays
+        instead of iterating MetricResult objects.
+
+        Args:
+            collector_name: Name of the collector
+
+        Returns:
+            MetricBatch over the cached results, or None if not collected
+        """
+        if collector_name not in self.metrics_cache:
+            return None
+        return MetricBatch.from_results(self.metrics_cache[collector_name])
+
+    def aggregate_metrics(self,
                         include_collectors: Optional[List[str]] = None,
-                        custom_weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+                        custom_weights: Optional[Dict[str, float]] = None,
+                        top_k: Optional[int] = None) -> Dict[str, Any]:
         """
         Aggregate all collected metrics.
-        
+
         Args:
             include_collectors: Optional list of collector names to include
             custom_weights: Optional custom weights for specific metrics
-        
+            top_k: Optional cap on the number of improvement areas retained
+
         Returns:
             Dictionary with aggregated metrics and improvement areas
         """
         all_metrics = []
-        
+        metrics_by_collector = {}
+
         # Use specified collectors or all collectors
         collectors_to_use = include_collectors or list(self.collectors.keys())
-        
-        # Flatten metrics from all collectors
+
+        # Single pass: flatten metrics for aggregation and group them by
+        # collector at the same time, applying the threshold only once
+        # per metric instead of in a second full iteration
         for name in collectors_to_use:
             if name not in self.metrics_cache:
                 continue
-            
+
+            collector_metrics = []
             for metric in self.metrics_cache[name]:
+                meets_threshold, distance = apply_threshold(metric.normalized_value, self.threshold)
+
+                # The precomputed threshold fields let the aggregation
+                # skip its own apply_threshold call per metric
                 all_metrics.append({
                     "name": metric.name,
                     "normalized_value": metric.normalized_value,
                     "raw_value": metric.raw_value,
                     "collector": name,
-                    "details": metric.details
+                    "details": metric.details,
+                    "meets_threshold": meets_threshold,
+                    "distance_to_threshold": distance
                 })
-        
-        # Aggregate metrics
-        aggregated = aggregate_metrics(all_metrics, self.threshold, custom_weights)
-        self.aggregated_metrics = aggregated
-        
-        # Add additional context
-        aggregated["threshold"] = self.threshold
-        aggregated["collectors_used"] = collectors_to_use
-        
-        # Group metrics by collector
-        metrics_by_collector = {}
-        for name in collectors_to_use:
-            if name not in self.metrics_cache:
-                continue
-            
-            collector_metrics = []
-            for metric in self.metrics_cache[name]:
-                meets_threshold, distance = apply_threshold(metric.normalized_value, self.threshold)
+
                 collector_metrics.append({
                     "name": metric.name,
                     "normalized_value": metric.normalized_value,
@@ -162,11 +420,18 @@ class MetricsManager:
                     "meets_threshold": meets_threshold,
                     "distance_to_threshold": distance
                 })
-            
+
             metrics_by_collector[name] = collector_metrics
-        
+
+        # Aggregate metrics
+        aggregated = aggregate_metrics(all_metrics, self.threshold, custom_weights, top_k=top_k)
+        self.aggregated_metrics = aggregated
+
+        # Add additional context
+        aggregated["threshold"] = self.threshold
+        aggregated["collectors_used"] = collectors_to_use
         aggregated["metrics_by_collector"] = metrics_by_collector
-        
+
         return aggregated
     
     def get_improvement_recommendations(self, max_recommendations: int = 5) -> List[Dict[str, Any]]:
@@ -207,29 +472,12 @@ class MetricsManager:
         """
         metric_name = recommendation.get("name", "")
         details = recommendation.get("details", {})
-        
-        # Use a mapping of metric types to advice generators to reduce complexity
-        advice_generators = {
-            "cyclomatic_complexity": self._get_complexity_advice,
-            "maintainability_index": self._get_maintainability_advice,
-            "comment_density": self._get_comment_advice,
-            "pylint_score": self._get_linting_advice,
-            "flake8_violations": self._get_linting_advice,
-            "black_compliance": self._get_formatting_advice,
-            "docstring": self._get_documentation_advice,
-            "coverage": self._get_coverage_advice,
-            "test_count": self._get_testing_advice,
-            "test_density": self._get_testing_advice,
-            "security_score": self._get_security_advice,
-            "critical_security_issues": self._get_security_advice,
-            "dependency_vulnerabilities": self._get_dependency_advice
-        }
-        
-        # Find the right advice generator based on partial matches
-        for pattern, generator in advice_generators.items():
-            if pattern in metric_name:
-                return generator(metric_name, details)
-        
+
+        # Find the right advice generator with a single scan of the name
+        match = self._advice_regex.search(metric_name)
+        if match:
+            return self._advice_generators[match.group(0)](metric_name, details)
+
         # Default advice for unknown metrics
         return "Identify specific areas for improvement and address them systematically."
     
@@ -237,8 +485,8 @@ class MetricsManager:
         """Generate advice for complexity metrics."""
         complex_functions = details.get("complex_functions", [])
         if complex_functions:
-            function_list = ", ".join([f"{func['function']} in {func['file']} (complexity: {func['complexity']})" 
-                                  for func in complex_functions[:3]])
+            function_list = ", ".join(f"{func['function']} in {func['file']} (complexity: {func['complexity']})"
+                                  for func in islice(complex_functions, 3))
             return f"Refactor complex functions to reduce cyclomatic complexity. Top candidates: {function_list}"
         return "Refactor functions to reduce cyclomatic complexity. Split large functions into smaller ones."
     
@@ -267,7 +515,7 @@ class MetricsManager:
         """Generate advice for coverage metrics."""
         low_coverage_files = details.get("low_coverage_files", [])
         if low_coverage_files:
-            file_list = ", ".join([f"{f['file']} ({f['coverage']:.1f}%)" for f in low_coverage_files[:3]])
+            file_list = ", ".join(f"{f['file']} ({f['coverage']:.1f}%)" for f in islice(low_coverage_files, 3))
             return f"Increase test coverage by writing tests for uncovered code. Focus on these files: {file_list}"
         return "Increase test coverage by writing more tests, especially for untested functionality."
     
@@ -279,8 +527,8 @@ class MetricsManager:
         """Generate advice for security metrics."""
         critical_issues = details.get("critical_issues", [])
         if critical_issues:
-            issue_list = ", ".join([f"{issue['test_name']} in {issue['file']}:{issue['line']}" 
-                               for issue in critical_issues[:3]])
+            issue_list = ", ".join(f"{issue['test_name']} in {issue['file']}:{issue['line']}"
+                               for issue in islice(critical_issues, 3))
             return f"Fix security issues identified by Bandit. Critical issues: {issue_list}"
         return "Address security vulnerabilities identified by static analysis tools."
     
@@ -288,7 +536,7 @@ class MetricsManager:
         """Generate advice for dependency metrics."""
         vulnerabilities = details.get("vulnerabilities", [])
         if vulnerabilities:
-            vuln_list = ", ".join([f"{v['dependency']} {v['installed_version']}" for v in vulnerabilities[:3]])
+            vuln_list = ", ".join(f"{v['dependency']} {v['installed_version']}" for v in islice(vulnerabilities, 3))
             return f"Update dependencies with security vulnerabilities: {vuln_list}"
         return "Update dependencies with known security vulnerabilities."
     
@@ -305,27 +553,38 @@ class MetricsManager:
         if not self.metrics_cache:
             logger.warning("No metrics to export. Run collect_all_metrics() first.")
             return ""
-        
-        # Convert metrics to serializable format
-        serializable_metrics = {}
-        for collector, metrics in self.metrics_cache.items():
-            serializable_metrics[collector] = [metric.to_dict() for metric in metrics]
-        
-        # Add aggregated metrics if available
-        export_data = {
-            "metrics": serializable_metrics
-        }
-        
-        if self.aggregated_metrics:
-            export_data["aggregated"] = self.aggregated_metrics
-        
+
         # Determine output path
         if not output_path:
             output_path = str(self.project_path / "metrics_report.json")
-        
-        # Write to file
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+
+        # Serialize with orjson when available (roughly an order of
+        # magnitude faster than stdlib json on large reports)
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            dumps = lambda obj: json.dumps(obj).encode()
+
+        # Stream the report one metric at a time instead of materializing
+        # the full serializable dict, so peak memory stays at a single
+        # metric's dict rather than ~2x the final JSON
+        with open(output_path, 'wb') as f:
+            f.write(b'{"metrics":{')
+            for i, (collector, metrics) in enumerate(self.metrics_cache.items()):
+                if i:
+                    f.write(b',')
+                f.write(dumps(collector))
+                f.write(b':[')
+                for j, metric in enumerate(metrics):
+                    if j:
+                        f.write(b',')
+                    f.write(dumps(metric.to_dict()))
+                f.write(b']')
+            f.write(b'}')
+            if self.aggregated_metrics:
+                f.write(b',"aggregated":')
+                f.write(dumps(self.aggregated_metrics))
+            f.write(b'}')
         
         logger.info(f"Exported metrics to {output_path}")
         return output_path
@@ -336,22 +595,27 @@ class MetricsManager:
             logger.warning("No aggregated metrics available. Run aggregate_metrics() first.")
             return
         
-        print("\n===== CODE QUALITY METRICS SUMMARY =====")
-        print(f"Overall Score: {self.aggregated_metrics['overall_score']:.2f} (Threshold: {self.threshold:.2f})")
-        print(f"Metrics above threshold: {self.aggregated_metrics['metrics_above_threshold']} / {self.aggregated_metrics['metrics_count']}")
-        
-        print("\n--- Top Improvement Areas ---")
+        # Assemble the summary in a buffer and emit it with one write, so
+        # the output stays a single syscall and can't interleave with
+        # log lines from parallel collectors
+        buf = io.StringIO()
+        buf.write("\n===== CODE QUALITY METRICS SUMMARY =====\n")
+        buf.write(f"Overall Score: {self.aggregated_metrics['overall_score']:.2f} (Threshold: {self.threshold:.2f})\n")
+        buf.write(f"Metrics above threshold: {self.aggregated_metrics['metrics_above_threshold']} / {self.aggregated_metrics['metrics_count']}\n")
+
+        buf.write("\n--- Top Improvement Areas ---\n")
         for i, area in enumerate(self.aggregated_metrics['improvement_areas'][:5]):
-            print(f"{i+1}. {area['name']}: {area['current_value']:.2f} (Distance to threshold: {area['distance_to_threshold']:.2f})")
-        
-        print("\n--- Metrics by Category ---")
+            buf.write(f"{i+1}. {area['name']}: {area['current_value']:.2f} (Distance to threshold: {area['distance_to_threshold']:.2f})\n")
+
+        buf.write("\n--- Metrics by Category ---\n")
         for collector, metrics in self.aggregated_metrics['metrics_by_collector'].items():
             above_threshold = sum(1 for m in metrics if m['meets_threshold'])
-            print(f"{collector.capitalize()}: {above_threshold}/{len(metrics)} metrics above threshold")
-        
-        print("\n--- Recommendations ---")
+            buf.write(f"{collector.capitalize()}: {above_threshold}/{len(metrics)} metrics above threshold\n")
+
+        buf.write("\n--- Recommendations ---\n")
         recommendations = self.get_improvement_recommendations()
         for i, rec in enumerate(recommendations):
-            print(f"{i+1}. {rec['advice']}")
-        
-        print("\n========================================")
+            buf.write(f"{i+1}. {rec['advice']}\n")
+
+        buf.write("\n========================================\n")
+        sys.stdout.write(buf.getvalue())
@@ -1,7 +1,14 @@
 """
 Normalization utilities for metrics.
 """
-from typing import Dict, List, Any, Optional, Tuple
+import heapq
+from operator import itemgetter
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def normalize_value(value: float, min_value: float, max_value: float, invert: bool = False) -> float:
@@ -33,6 +40,32 @@ def normalize_value(value: float, min_value: float, max_value: float, invert: bo
     return normalized
 
 
+def make_normalizer(min_value: float, max_value: float, invert: bool = False) -> Callable[[float], float]:
+    """
+    Build a specialized normalizer for a fixed value range.
+
+    Callers that normalize many values against the same constants (e.g.
+    a 0-10 score) can bake the range into a closure once: the reciprocal
+    of the range is precomputed and the invert branch disappears from
+    the per-value call.
+
+    Args:
+        min_value: The minimum expected value
+        max_value: The maximum expected value
+        invert: Whether to invert the normalization (1 - norm)
+
+    Returns:
+        A callable mapping a raw value to the 0-1 range
+    """
+    if max_value == min_value:
+        return lambda value: 0.5  # Avoid division by zero
+
+    inv_range = 1.0 / (max_value - min_value)
+    if invert:
+        return lambda value: 1 - (max(min_value, min(max_value, value)) - min_value) * inv_range
+    return lambda value: (max(min_value, min(max_value, value)) - min_value) * inv_range
+
+
 def apply_threshold(normalized_value: float, threshold: float = 0.95) -> Tuple[bool, float]:
     """
     Apply a threshold to a normalized value.
@@ -69,22 +102,34 @@ def calculate_weight(normalized_value: float, threshold: float = 0.95, exponenti
     
     # Calculate distance from threshold
     distance = threshold - normalized_value
-    
-    # Apply exponential weighting
+
+    # Apply exponential weighting; plain multiplies beat float pow for
+    # the common small integer exponents
+    if exponential == 2.0:
+        return distance * distance
+    if exponential == 1.0:
+        return distance
+    if exponential == 3.0:
+        return distance * distance * distance
     return distance ** exponential
 
 
-def aggregate_metrics(metrics: List[Dict[str, Any]], 
+def aggregate_metrics(metrics: List[Dict[str, Any]],
                      threshold: float = 0.95,
-                     weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+                     weights: Optional[Dict[str, float]] = None,
+                     top_k: Optional[int] = None) -> Dict[str, Any]:
     """
     Aggregate metrics into an overall score and identify areas for improvement.
-    
+
     Args:
-        metrics: List of metric dictionaries with 'name' and 'normalized_value'
+        metrics: List of metric dictionaries with 'name' and 'normalized_value';
+            precomputed 'meets_threshold'/'distance_to_threshold' entries are
+            reused instead of re-applying the threshold
         threshold: The target threshold for all metrics
         weights: Optional custom weights for specific metrics
-    
+        top_k: Optional cap on the number of improvement areas to keep;
+            uses a size-K heap instead of retaining and sorting all areas
+
     Returns:
         Dictionary with aggregated metrics and improvement areas
     """
@@ -97,24 +142,31 @@ def aggregate_metrics(metrics: List[Dict[str, Any]],
             "improvement_areas": []
         }
     
+    if np is not None:
+        return _aggregate_metrics_numpy(metrics, threshold, weights, top_k)
+
     # Calculate overall score and counts
     total_score = 0.0
     metrics_above_threshold = 0
     metrics_below_threshold = 0
-    
+
     # Prepare improvement areas
     improvement_areas = []
-    
+
     # Process each metric
     for metric in metrics:
         name = metric.get("name", "unknown")
         value = metric.get("normalized_value", 0.0)
-        
+
         # Add to total score
         total_score += value
-        
-        # Check threshold
-        meets_threshold, distance = apply_threshold(value, threshold)
+
+        # Check threshold, reusing values precomputed by the caller
+        meets_threshold = metric.get("meets_threshold")
+        if meets_threshold is None:
+            meets_threshold, distance = apply_threshold(value, threshold)
+        else:
+            distance = metric.get("distance_to_threshold", value - threshold)
         
         if meets_threshold:
             metrics_above_threshold += 1
@@ -133,9 +185,15 @@ def aggregate_metrics(metrics: List[Dict[str, Any]],
                 "improvement_weight": improvement_weight,
                 "details": metric.get("details", {})
             })
-    
-    # Sort improvement areas by weight (descending)
-    improvement_areas.sort(key=lambda x: x["improvement_weight"], reverse=True)
+
+    # Order improvement areas by weight (descending); with top_k a partial
+    # heap selection replaces the full sort (O(N log K) vs O(N log N))
+    if top_k is None:
+        improvement_areas.sort(key=itemgetter("improvement_weight"), reverse=True)
+    else:
+        improvement_areas = heapq.nlargest(
+            top_k, improvement_areas, key=itemgetter("improvement_weight")
+        )
     
     # Calculate overall score
     overall_score = total_score / len(metrics) if metrics else 0.0
@@ -147,3 +205,67 @@ def aggregate_metrics(metrics: List[Dict[str, Any]],
         "metrics_below_threshold": metrics_below_threshold,
         "improvement_areas": improvement_areas
     }
+
+
+def _aggregate_metrics_numpy(metrics: List[Dict[str, Any]],
+                             threshold: float,
+                             weights: Optional[Dict[str, float]],
+                             top_k: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Vectorized implementation of aggregate_metrics.
+
+    Computes the threshold checks and exponential weights as NumPy array
+    operations instead of per-metric Python calls, which matters once
+    thousands of metrics are aggregated.
+
+    Args:
+        metrics: List of metric dictionaries with 'name' and 'normalized_value'
+        threshold: The target threshold for all metrics
+        weights: Optional custom weights for specific metrics
+
+    Returns:
+        Dictionary with aggregated metrics and improvement areas
+    """
+    count = len(metrics)
+    values = np.fromiter(
+        (metric.get("normalized_value", 0.0) for metric in metrics),
+        dtype=np.float64, count=count
+    )
+
+    meets = values >= threshold
+    improvement_weights = np.where(meets, 0.0, (threshold - values) ** 2.0)
+
+    if weights:
+        custom = np.fromiter(
+            (weights.get(metric.get("name", "unknown"), 1.0) for metric in metrics),
+            dtype=np.float64, count=count
+        )
+        improvement_weights *= custom
+
+    # Build improvement areas for below-threshold metrics, ordered by weight
+    below_indices = np.flatnonzero(~meets)
+    if top_k is not None and top_k < below_indices.size:
+        # Partial selection of the K heaviest areas before the final sort
+        keep = np.argpartition(-improvement_weights[below_indices], top_k - 1)[:top_k]
+        below_indices = below_indices[keep]
+    order = below_indices[np.argsort(-improvement_weights[below_indices], kind="stable")]
+
+    improvement_areas = []
+    for idx in order:
+        metric = metrics[idx]
+        value = float(values[idx])
+        improvement_areas.append({
+            "name": metric.get("name", "unknown"),
+            "current_value": value,
+            "distance_to_threshold": abs(value - threshold),
+            "improvement_weight": float(improvement_weights[idx]),
+            "details": metric.get("details", {})
+        })
+
+    return {
+        "overall_score": float(values.sum()) / count,
+        "metrics_count": count,
+        "metrics_above_threshold": int(meets.sum()),
+        "metrics_below_threshold": count - int(meets.sum()),
+        "improvement_areas": improvement_areas
+    }
@@ -1,24 +1,60 @@
 """
 Security and vulnerability metrics collection.
 """
+import functools
 import json
+import os
 import re
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
+import shutil
 import subprocess
+import tempfile
+import threading
 import logging
 
-from autodev.metrics.base import MetricsCollector, MetricResult, normalize_value, create_error_metric
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when available, falling back to stdlib json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+from autodev.metrics.base import MetricsCollector, MetricResult, create_error_metric, run_collectors_parallel
 
 logger = logging.getLogger(__name__)
 
+# Severity weights used to turn bandit issue counts into a score
+_BANDIT_SEVERITY_WEIGHTS = (("HIGH", 5), ("MEDIUM", 2), ("LOW", 1))
+
+# Severity weights for safety vulnerability counts
+_SAFETY_SEVERITY_WEIGHTS = (("critical", 10), ("high", 5), ("medium", 2), ("low", 1))
+
+@functools.lru_cache(maxsize=32)
 def _is_tool_available(tool_name: str) -> bool:
     """Check if a tool is available on the system."""
-    try:
-        subprocess.run([tool_name, "--version"], check=True, stdout=subprocess.DEVNULL)
-        return True
-    except FileNotFoundError:
-        return False
+    # A PATH scan stays in-process and is sub-millisecond; running
+    # `tool --version` forks a child process. The subprocess probe is
+    # kept behind an env var for PATH entries that are shims and only
+    # prove themselves when executed.
+    if os.environ.get("AUTODEV_PROBE_TOOLS"):
+        try:
+            subprocess.run([tool_name, "--version"], check=True, stdout=subprocess.DEVNULL)
+            return True
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            return False
+    return shutil.which(tool_name) is not None
 
 class SecurityMetricsCollector(MetricsCollector):
     """Collector for security and vulnerability metrics."""
@@ -30,28 +66,45 @@ class SecurityMetricsCollector(MetricsCollector):
         Returns:
             List of MetricResult objects
         """
-        metrics = []
-        
-        # Collect bandit metrics (static security analysis)
-        metrics.extend(self._collect_bandit_metrics())
-        
-        # Collect safety metrics (dependency vulnerabilities)
-        metrics.extend(self._collect_safety_metrics())
-        
-        return metrics
+        # Run bandit (static security analysis) and safety (dependency
+        # vulnerabilities) concurrently
+        return run_collectors_parallel([
+            self._collect_bandit_metrics,
+            self._collect_safety_metrics
+        ])
     
     def _collect_bandit_metrics(self) -> List[MetricResult]:
         """
         Collect security metrics using bandit.
-        
+
         Returns:
             List of MetricResult objects
         """
-        # Run bandit command with JSON output
-        return_code, stdout, stderr = self.run_command(
-            ["bandit", "-r", "-f", "json", "."]
-        )
-        
+        # Nothing for bandit to scan without Python sources; checking up
+        # front saves the subprocess launch on empty subprojects
+        if not self._has_python_files():
+            logger.warning("No Python files found, skipping bandit metrics")
+            return []
+
+        # Stream the report when ijson is available: bandit emits a source
+        # snippet per finding, but we only consume the issue severities
+        if ijson is not None:
+            return self._collect_bandit_metrics_streaming()
+
+        # Without ijson the full report has to be materialized anyway, so
+        # have bandit write it straight to a temp file (-o): the JSON is
+        # buffered once on disk instead of once in the pipe and again in
+        # the parent process
+        report_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
+        report_file.close()
+        try:
+            cmd = self._bandit_command()
+            cmd[1:1] = ["-o", report_file.name]
+            return_code, _, stderr = self.run_command(cmd)
+            stdout = Path(report_file.name).read_bytes()
+        finally:
+            os.unlink(report_file.name)
+
         # bandit returns 0 for no issues, 1 for issues found
         if return_code not in (0, 1) or not stdout:
             # If bandit isn't installed, we'll set a neutral fallback value (0.5)
@@ -70,118 +123,242 @@ class SecurityMetricsCollector(MetricsCollector):
         
         try:
             # Parse bandit JSON output
-            security_data = json.loads(stdout)
-            
-            # Get metrics from results
-            metrics_data = security_data.get("metrics", {})
-            
-            # Count issues by severity
+            security_data = _loads(stdout)
+
+            # Count issues by severity in one C-level pass
             results = security_data.get("results", [])
+            counts = Counter(result.get("issue_severity", "").upper() for result in results)
+            issues_by_severity = {
+                severity: counts.get(severity, 0)
+                for severity, _ in _BANDIT_SEVERITY_WEIGHTS
+            }
+
+            return [self._build_bandit_metric(issues_by_severity)]
+        except (ValueError, KeyError) as e:
+            return [create_error_metric(
+                "security_score",
+                f"Error parsing bandit output: {e}"
+            )]
+
+    def _has_python_files(self) -> bool:
+        """
+        Check whether the project contains any Python files.
+
+        Returns:
+            True if at least one .py file exists
+        """
+        if self.project_files is not None:
+            return len(self.project_files) > 0
+        # glob is lazy, so this stops at the first match
+        return any(self.project_path.glob("**/*.py"))
+
+    def _bandit_command(self) -> List[str]:
+        """
+        Build the bandit command line.
+
+        When a shared file list was injected, the files are passed
+        explicitly so bandit skips its own recursive directory walk.
+
+        Returns:
+            Bandit command as a list of strings
+        """
+        # -q drops bandit's per-file progress chatter on stderr, which is
+        # otherwise read into the parent and discarded
+        if self.project_files:
+            return ["bandit", "-q", "-f", "json"] + list(self.project_files)
+        return ["bandit", "-q", "-r", "-f", "json", "."]
+
+    def _collect_bandit_metrics_streaming(self) -> List[MetricResult]:
+        """
+        Collect bandit metrics by streaming the JSON report with ijson.
+
+        Only the per-result issue severities are pulled out of the report
+        as it arrives on the pipe, so peak memory stays constant instead
+        of holding bandit's full output (which includes source snippets
+        for every finding).
+
+        Returns:
+            List of MetricResult objects
+        """
+        try:
+            process = subprocess.Popen(
+                self._bandit_command(),
+                cwd=str(self.project_path),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except Exception as e:
+            logger.exception(f"Error running bandit: {e}")
+            return [create_error_metric("security_score", f"Failed to run bandit: {e}")]
+
+        # Drain stderr in the background while stdout is being streamed,
+        # so a large error trace can't fill the pipe and deadlock bandit
+        stderr_chunks = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read())
+        )
+        stderr_reader.start()
+
+        try:
             issues_by_severity = {
                 "HIGH": 0,
                 "MEDIUM": 0,
                 "LOW": 0
             }
-            
-            for result in results:
-                severity = result.get("issue_severity", "").upper()
+
+            for severity in ijson.items(process.stdout, "results.item.issue_severity"):
+                severity = str(severity).upper()
                 if severity in issues_by_severity:
                     issues_by_severity[severity] += 1
-            
-            # Calculate security score
-            total_issues = sum(issues_by_severity.values())
-            weighted_issues = (
-                issues_by_severity["HIGH"] * 5 +
-                issues_by_severity["MEDIUM"] * 2 +
-                issues_by_severity["LOW"]
-            )
-            
-            # Calculate score (10 - weighted issues, min 0)
-            raw_score = max(0, 10 - weighted_issues)
-            score = normalize_value(raw_score, 0, 10)
-            
-            return [MetricResult(
-                name="security_score",
-                raw_value=raw_score,
-                normalized_value=score,
-                details={
-                    "issues_high": issues_by_severity["HIGH"],
-                    "issues_medium": issues_by_severity["MEDIUM"],
-                    "issues_low": issues_by_severity["LOW"],
-                    "total_issues": total_issues
-                }
-            )]
-        except (json.JSONDecodeError, KeyError) as e:
+
+            stderr_reader.join()
+            stderr = b"".join(stderr_chunks).decode(errors="replace")
+            return_code = process.wait()
+
+            # bandit returns 0 for no issues, 1 for issues found
+            if return_code not in (0, 1):
+                return [create_error_metric(
+                    "security_score",
+                    f"Failed to run bandit: {stderr}"
+                )]
+
+            return [self._build_bandit_metric(issues_by_severity)]
+        except Exception as e:
+            process.kill()
+            process.wait()
+            stderr_reader.join()
             return [create_error_metric(
-                "security_score", 
+                "security_score",
                 f"Error parsing bandit output: {e}"
             )]
-            
+
+    def _build_bandit_metric(self, issues_by_severity: Dict[str, int]) -> MetricResult:
+        """
+        Build the security score metric from severity counts.
+
+        Args:
+            issues_by_severity: Counts of issues keyed by HIGH/MEDIUM/LOW
+
+        Returns:
+            MetricResult for the security score
+        """
+        # Calculate security score
+        total_issues = sum(issues_by_severity.values())
+        weighted_issues = sum(
+            issues_by_severity.get(severity, 0) * weight
+            for severity, weight in _BANDIT_SEVERITY_WEIGHTS
+        )
+
+        # Calculate score (10 - weighted issues, min 0); the score is
+        # already clamped to [0, 10], so normalizing is a single multiply
+        raw_score = max(0, 10 - weighted_issues)
+        score = raw_score * 0.1
+
+        return MetricResult(
+            name="security_score",
+            raw_value=raw_score,
+            normalized_value=score,
+            details={
+                "issues_high": issues_by_severity["HIGH"],
+                "issues_medium": issues_by_severity["MEDIUM"],
+                "issues_low": issues_by_severity["LOW"],
+                "total_issues": total_issues
+            }
+        )
+
+    def _dependency_count(self, requirements_file: Path) -> int:
+        """
+        Count declared dependencies in a requirements file.
+
+        The file is read in one go and the count is cached keyed on the
+        file's mtime, so repeated collect() calls skip the re-read.
+
+        Args:
+            requirements_file: Path to the requirements.txt file
+
+        Returns:
+            Number of non-empty, non-comment lines
+        """
+        mtime = requirements_file.stat().st_mtime_ns
+        cached = getattr(self, "_dependency_count_cache", None)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        count = sum(
+            1 for line in requirements_file.read_text().splitlines()
+            if (stripped := line.strip()) and not stripped.startswith('#')
+        )
+        self._dependency_count_cache = (mtime, count)
+        return count
+
     def _collect_safety_metrics(self) -> List[MetricResult]:
         """Collect security metrics for dependencies using safety."""
         # Check if tool is available
         if not _is_tool_available("safety"):
             logger.warning("safety not installed, skipping metrics")
             return []
-            
-        # Run safety check
+
+        # Nothing to check without a requirements file
+        requirements_file = self.project_path / "requirements.txt"
+        if not requirements_file.exists():
+            logger.warning("No requirements.txt found, skipping safety metrics")
+            return []
+
+        # Run safety check, keeping the JSON output as bytes
         safety_output = subprocess.run(
-            ["safety", "check", "--json", "-r", f"{self.project_path}/requirements.txt"],
-            capture_output=True, text=True, check=False
+            ["safety", "check", "--json", "-r", str(requirements_file)],
+            capture_output=True, check=False
         )
         
         # Safety returns 0 for no vulnerabilities, 1 for vulnerabilities found
         if safety_output.returncode > 1:
-            logger.error(f"Error running safety: {safety_output.stderr}")
-            return [create_error_metric("dependency_vulnerabilities", f"Error running safety: {safety_output.stderr}")]
+            stderr = safety_output.stderr.decode(errors="replace")
+            logger.error(f"Error running safety: {stderr}")
+            return [create_error_metric("dependency_vulnerabilities", f"Error running safety: {stderr}")]
         
         try:
             # Parse safety output
             try:
-                results = json.loads(safety_output.stdout)
+                results = _loads(safety_output.stdout)
                 vulnerabilities = results.get("vulnerabilities", [])
-            except json.JSONDecodeError:
+            except ValueError:
                 # This might be an older version with a different output format
-                if "No vulnerable packages found" in safety_output.stdout:
+                if b"No vulnerable packages found" in safety_output.stdout:
                     vulnerabilities = []
                 else:
                     raise ValueError("Unable to parse safety output")
 
-            # Count vulnerabilities by severity
+            # Count vulnerabilities by severity in one C-level pass
+            counts = Counter(vuln.get("severity", "").lower() for vuln in vulnerabilities)
             severity_counts = {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0
+                severity: counts.get(severity, 0)
+                for severity, _ in _SAFETY_SEVERITY_WEIGHTS
             }
-            
-            vuln_details = []
-            for vuln in vulnerabilities:
-                severity = vuln.get("severity", "").lower()
-                if severity in severity_counts:
-                    severity_counts[severity] += 1
-                
-                vuln_details.append({
+
+            vuln_details = [
+                {
                     "dependency": vuln.get("package_name", "unknown"),
                     "installed_version": vuln.get("installed_version", "unknown"),
                     "affected_versions": vuln.get("vulnerable_spec", "unknown"),
-                    "severity": severity,
+                    "severity": vuln.get("severity", "").lower(),
                     "description": vuln.get("advisory", "")
-                })
+                }
+                for vuln in vulnerabilities
+            ]
             
             # Calculate score - 0 vulnerabilities = 1.0, 5+ vulnerabilities = 0.0
             total_vulnerabilities = sum(severity_counts.values())
             
-            # Apply severity weighting
-            weighted_score = (
-                severity_counts["critical"] * 10 +
-                severity_counts["high"] * 5 +
-                severity_counts["medium"] * 2 +
-                severity_counts["low"] * 1
+            # Apply severity weighting from the module-level weight vector
+            weighted_score = sum(
+                severity_counts[severity] * weight
+                for severity, weight in _SAFETY_SEVERITY_WEIGHTS
             )
             
-            # Normalize: 0 weighted vulns = 1.0, 20+ weighted vulns = 0.0
-            normalized_score = normalize_value(weighted_score, 0, 20, invert=True)
+            # Normalize: 0 weighted vulns = 1.0, 20+ weighted vulns = 0.0;
+            # weighted_score is non-negative, so only the lower clamp is needed
+            normalized_score = max(0.0, 1.0 - weighted_score * 0.05)
             
             return [
                 MetricResult(
@@ -191,7 +368,8 @@ class SecurityMetricsCollector(MetricsCollector):
                     success=True,
                     details={
                         "severity_counts": severity_counts,
-                        "vulnerabilities": vuln_details
+                        "vulnerabilities": vuln_details,
+                        "dependencies_count": self._dependency_count(requirements_file)
                     }
                 )
             ]
@@ -6,12 +6,65 @@ import logging
 from typing import Dict, List, Set, Optional, Tuple, Callable, Any
 from datetime import datetime, timedelta
 import heapq
+from collections import defaultdict
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if np is not None:
+    # Day-offset bucket edges and urgency factors for the deadline
+    # ladder; searchsorted against the edges picks the factor branchlessly
+    _URGENCY_BINS = np.array([0, 1, 3, 7])
+    _URGENCY_FACTORS = np.array([5.0, 3.0, 2.0, 1.5, 1.0])
+
+    def _priority_kernel(base_prio, dep_counts, dependent_counts, depths,
+                         effort, urgency, is_critical, active, weights):
+        """
+        Combine the gathered task arrays into effective priorities.
+
+        A pure numeric kernel over parallel arrays: weighted sum, the
+        1.5x critical-path multiplier, then effort and urgency terms,
+        zeroed for inactive tasks. `weights` is the 6-element vector
+        (base_priority, dependency_count, dependent_count, path_depth,
+        effort, urgency).
+        """
+        priorities = (
+            base_prio * weights[0]
+            + dep_counts * weights[1]
+            + dependent_counts * weights[2]
+            + depths * weights[3]
+        )
+        # The critical-path bonus multiplies before effort and urgency
+        # are added, matching the scalar loop's ordering
+        priorities = np.where(is_critical, priorities * 1.5, priorities)
+        priorities = priorities + effort * weights[4] + urgency * weights[5]
+        return np.where(active, priorities, 0.0)
+
+    if numba is not None:
+        # JIT-compile the kernel when numba is installed; the body is
+        # plain array arithmetic, so the same function works either way
+        _priority_kernel = numba.njit(cache=True)(_priority_kernel)
 
 from autodev.planning.task import Task, TaskStatus, Priority
 from autodev.planning.graph import TaskGraph
 
 logger = logging.getLogger(__name__)
 
+# Status sets for the hot filters; frozenset membership beats building
+# and scanning a tuple per task
+_INACTIVE_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.CANCELLED})
+_NOT_READY_STATUSES = frozenset(
+    {TaskStatus.BLOCKED, TaskStatus.COMPLETED, TaskStatus.CANCELLED}
+)
+
 
 class TaskScheduler:
     """
@@ -42,6 +95,70 @@ class TaskScheduler:
             "effort": 0.8,  # Weight for the estimated effort
             "urgency": 1.2,  # Weight for time-based urgency factors
         }
+
+        # Structural-analysis and schedule caches keyed by the graph's
+        # version counter, so repeated scheduler calls on an unchanged
+        # graph skip the critical-path and depth recomputation
+        self._structural_cache: Optional[Tuple[int, Set[str], Dict[str, int]]] = None
+        self._schedule_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+        # Parsed deadline strings; the same ISO string always parses to
+        # the same datetime, so repeated priority runs skip fromisoformat
+        self._deadline_cache: Dict[str, Optional[datetime]] = {}
+
+        # Last computed priority map and the graph version it was built
+        # against; get_prioritized_tasks/get_next_tasks call
+        # calculate_effective_priorities defensively, so a warm cache
+        # turns those calls into a dict return
+        self._last_priorities: Dict[str, float] = {}
+        self._priorities_version: int = -1
+
+    def _parse_deadline(self, value: str) -> Optional[datetime]:
+        """
+        Parse a deadline string, caching the result by its text.
+
+        Args:
+            value: ISO-format deadline string
+
+        Returns:
+            Parsed datetime, or None when the value is invalid
+        """
+        cache = self._deadline_cache
+        if value in cache:
+            return cache[value]
+        try:
+            deadline = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            # Invalid deadline format - ignore
+            deadline = None
+        cache[value] = deadline
+        return deadline
+
+    def _cached_structural_analysis(self) -> Tuple[Set[str], Dict[str, int]]:
+        """
+        Get critical-path membership and path depths for the current graph.
+
+        Both are pure functions of the graph topology, so the results are
+        cached against the graph's version counter and reused until a
+        task or edge changes.
+
+        Returns:
+            Tuple of (critical path task IDs, path depths by task ID)
+        """
+        version = self.task_graph._version
+        cached = self._structural_cache
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        try:
+            critical_path_ids = {task.id for task in self.task_graph.calculate_critical_path()}
+        except Exception as e:
+            logger.warning(f"Failed to calculate critical path: {e}")
+            critical_path_ids = set()
+
+        path_depths = self._calculate_path_depths()
+        self._structural_cache = (version, critical_path_ids, path_depths)
+        return critical_path_ids, path_depths
     
     def calculate_effective_priorities(
         self,
@@ -56,83 +173,80 @@ class TaskScheduler:
         Returns:
             Dictionary mapping task IDs to their effective priority values
         """
+        version = self.task_graph._version
         if weights:
             # Update weights but keep defaults for missing keys
             for key, value in weights.items():
                 if key in self.priority_weights:
                     self.priority_weights[key] = value
+        elif self._priorities_version == version:
+            # Nothing structural changed and no weight override: the
+            # last computed priorities are still valid
+            return self._last_priorities
         
         effective_priorities = {}
-        
-        # Calculate critical path to identify key tasks
-        try:
-            critical_path_tasks = {task.id for task in self.task_graph.calculate_critical_path()}
-        except Exception as e:
-            logger.warning(f"Failed to calculate critical path: {e}")
-            critical_path_tasks = set()
-        
-        # Calculate the maximum path depth for each task
-        path_depths = self._calculate_path_depths()
-        
+
+        # Critical path and path depths come from the version-keyed cache
+        critical_path_tasks, path_depths = self._cached_structural_analysis()
+
+        # On larger graphs the per-task Python arithmetic dominates, so
+        # compute the priorities over parallel arrays instead of task
+        # objects (structure-of-arrays) when numpy is available
+        if np is not None and len(self.task_graph.tasks) >= 64:
+            effective_priorities = self._calculate_effective_priorities_numpy(
+                critical_path_tasks, path_depths
+            )
+            self._last_priorities = effective_priorities
+            self._priorities_version = version
+            return effective_priorities
+
+        # Hoist the weight and method lookups out of the loop; inside it
+        # they would cost six dict hashes plus attribute chases per task
+        weights_map = self.priority_weights
+        w_base = weights_map["base_priority"]
+        w_dep_count = weights_map["dependency_count"]
+        w_dependents = weights_map["dependent_count"]
+        w_depth = weights_map["path_depth"]
+        w_effort = weights_map["effort"]
+        w_urgency = weights_map["urgency"]
+        get_dependencies = self.task_graph.get_dependencies
+        get_all_dependents = self.task_graph.get_all_dependents
+
         # Calculate effective priority for each task
         for task_id, task in self.task_graph.tasks.items():
             # Skip completed or cancelled tasks
-            if task.status in (TaskStatus.COMPLETED, TaskStatus.CANCELLED):
+            if task.status in _INACTIVE_STATUSES:
                 effective_priorities[task_id] = 0.0
                 continue
             
             # Base priority from task's intrinsic priority
-            priority = task.priority.value * self.priority_weights["base_priority"]
+            priority = task.priority_value * w_base
             
             # Factor in the number of dependencies
-            deps = self.task_graph.get_dependencies(task_id)
+            deps = get_dependencies(task_id)
             if deps:
-                priority += len(deps) * self.priority_weights["dependency_count"]
+                priority += len(deps) * w_dep_count
             
             # Factor in the number of dependents (more dependents = higher priority)
-            dependents = self.task_graph.get_all_dependents(task_id)
+            dependents = get_all_dependents(task_id)
             if dependents:
-                priority += len(dependents) * self.priority_weights["dependent_count"]
+                priority += len(dependents) * w_dependents
             
             # Factor in path depth (longer path = higher priority)
             if task_id in path_depths:
-                priority += path_depths[task_id] * self.priority_weights["path_depth"]
+                priority += path_depths[task_id] * w_depth
             
             # Bonus for critical path tasks
             if task_id in critical_path_tasks:
                 priority *= 1.5
             
             # Factor in effort (higher effort might need earlier start)
-            priority += task.estimated_effort * self.priority_weights["effort"]
+            priority += task.estimated_effort * w_effort
             
             # Factor in urgency based on metadata if available
-            if "deadline" in task.metadata:
-                try:
-                    deadline = datetime.fromisoformat(task.metadata["deadline"])
-                    now = datetime.now()
-                    days_until_deadline = (deadline - now).days
-                    
-                    # More urgent as deadline approaches
-                    if days_until_deadline <= 0:
-                        # Past deadline - highest urgency
-                        urgency_factor = 5.0
-                    elif days_until_deadline <= 1:
-                        # Due today or tomorrow
-                        urgency_factor = 3.0
-                    elif days_until_deadline <= 3:
-                        # Due within 3 days
-                        urgency_factor = 2.0
-                    elif days_until_deadline <= 7:
-                        # Due within a week
-                        urgency_factor = 1.5
-                    else:
-                        # Due later
-                        urgency_factor = 1.0
-                        
-                    priority += urgency_factor * self.priority_weights["urgency"]
-                except (ValueError, TypeError):
-                    # Invalid deadline format - ignore
-                    pass
+            urgency_factor = self._deadline_urgency(task)
+            if urgency_factor is not None:
+                priority += urgency_factor * w_urgency
             
             # Store the calculated priority
             effective_priorities[task_id] = priority
@@ -140,7 +254,133 @@ class TaskScheduler:
             # Update the task object
             task.set_effective_priority(priority)
         
+        self._last_priorities = effective_priorities
+        self._priorities_version = version
         return effective_priorities
+
+    def _deadline_urgency(self, task: Task) -> Optional[float]:
+        """
+        Get the urgency factor for a task's deadline, if it has one.
+
+        Args:
+            task: The task to inspect
+
+        Returns:
+            Urgency factor, or None when no valid deadline is set
+        """
+        if "deadline" not in task.metadata:
+            return None
+        deadline = self._parse_deadline(task.metadata["deadline"])
+        if deadline is None:
+            return None
+
+        days_until_deadline = (deadline - datetime.now()).days
+
+        # More urgent as deadline approaches
+        if days_until_deadline <= 0:
+            # Past deadline - highest urgency
+            return 5.0
+        elif days_until_deadline <= 1:
+            # Due today or tomorrow
+            return 3.0
+        elif days_until_deadline <= 3:
+            # Due within 3 days
+            return 2.0
+        elif days_until_deadline <= 7:
+            # Due within a week
+            return 1.5
+        # Due later
+        return 1.0
+
+    def _calculate_effective_priorities_numpy(
+        self,
+        critical_path_tasks: Set[str],
+        path_depths: Dict[str, int]
+    ) -> Dict[str, float]:
+        """
+        Vectorized priority calculation over parallel arrays.
+
+        Mirrors the scalar loop in calculate_effective_priorities: the
+        per-task fields are gathered once into dense arrays and the
+        weighted combination runs as a handful of array operations
+        instead of per-task Python arithmetic.
+
+        Args:
+            critical_path_tasks: IDs of tasks on the critical path
+            path_depths: Maximum path depth per task ID
+
+        Returns:
+            Dictionary mapping task IDs to their effective priority values
+        """
+        graph = self.task_graph
+        task_ids = list(graph.tasks)
+        tasks = list(graph.tasks.values())
+        count = len(tasks)
+        weights = self.priority_weights
+
+        active = np.fromiter(
+            (task.status not in _INACTIVE_STATUSES for task in tasks),
+            dtype=bool, count=count
+        )
+        base_prio = np.fromiter(
+            (task.priority_value for task in tasks), dtype=np.float64, count=count
+        )
+        effort = np.fromiter(
+            (task.estimated_effort for task in tasks), dtype=np.float64, count=count
+        )
+        dep_counts = np.fromiter(
+            (len(graph.get_dependencies(tid)) for tid in task_ids),
+            dtype=np.float64, count=count
+        )
+        dependent_counts = np.fromiter(
+            (len(graph.get_all_dependents(tid)) for tid in task_ids),
+            dtype=np.float64, count=count
+        )
+        depths = np.fromiter(
+            (path_depths.get(tid, 0) for tid in task_ids),
+            dtype=np.float64, count=count
+        )
+        is_critical = np.fromiter(
+            (tid in critical_path_tasks for tid in task_ids),
+            dtype=bool, count=count
+        )
+        # Deadline urgency: bucket the day offsets against the ladder
+        # edges with searchsorted instead of running the if/elif chain
+        # per task
+        now = datetime.now()
+        deadline_days = np.full(count, np.nan)
+        for idx, task in enumerate(tasks):
+            value = task.metadata.get("deadline")
+            if value is None:
+                continue
+            deadline = self._parse_deadline(value)
+            if deadline is not None:
+                deadline_days[idx] = (deadline - now).days
+        has_deadline = ~np.isnan(deadline_days)
+        urgency = np.zeros(count)
+        if has_deadline.any():
+            buckets = np.searchsorted(_URGENCY_BINS, deadline_days[has_deadline])
+            urgency[has_deadline] = _URGENCY_FACTORS[buckets]
+
+        weight_vector = np.array([
+            weights["base_priority"], weights["dependency_count"],
+            weights["dependent_count"], weights["path_depth"],
+            weights["effort"], weights["urgency"],
+        ])
+        priorities = _priority_kernel(
+            base_prio, dep_counts, dependent_counts, depths,
+            effort, urgency, is_critical, active, weight_vector
+        )
+
+        # Scatter back to the task objects in one tight loop; tolist()
+        # unboxes the whole array at C level, and writing the backing
+        # attribute directly (as Task.from_dict does) skips a method
+        # call per task
+        values = priorities.tolist()
+        for task, priority in zip(tasks, values):
+            task._effective_priority = priority
+
+        return dict(zip(task_ids, values))
     
     def get_prioritized_tasks(self) -> List[Task]:
         """
@@ -155,7 +395,7 @@ class TaskScheduler:
         # Get all non-completed, non-cancelled tasks
         active_tasks = [
             task for task in self.task_graph.tasks.values()
-            if task.status not in (TaskStatus.COMPLETED, TaskStatus.CANCELLED)
+            if task.status not in _INACTIVE_STATUSES
         ]
         
         # Sort by effective priority (descending)
@@ -180,20 +420,15 @@ class TaskScheduler:
         # Make sure priorities are calculated
         self.calculate_effective_priorities()
         
-        # Get only tasks that are ready to work on (not blocked, not completed, not cancelled)
-        ready_tasks = [
-            task for task in self.task_graph.tasks.values()
-            if task.status not in (TaskStatus.BLOCKED, TaskStatus.COMPLETED, TaskStatus.CANCELLED)
-        ]
-        
-        # Sort by effective priority (descending)
-        sorted_tasks = sorted(
-            ready_tasks,
-            key=lambda t: t.effective_priority,
-            reverse=True
+        # Get only tasks that are ready to work on (not blocked, not
+        # completed, not cancelled), keeping just the top `limit` by
+        # priority: nlargest is O(N log limit) versus a full sort
+        return heapq.nlargest(
+            limit,
+            (task for task in self.task_graph.tasks.values()
+             if task.status not in _NOT_READY_STATUSES),
+            key=lambda t: t.effective_priority
         )
-        
-        return sorted_tasks[:limit]
     
     def _calculate_path_depths(self) -> Dict[str, int]:
         """
@@ -205,37 +440,21 @@ class TaskScheduler:
         Returns:
             Dictionary mapping task IDs to their maximum path depths
         """
-        path_depths = {}
-        
-        # Get all root tasks (those with no dependencies)
-        root_tasks = self.task_graph.get_root_tasks()
-        
-        # For each root task, calculate path depths for all tasks reachable from it
-        for root_task in root_tasks:
-            self._dfs_path_depth(root_task.id, 0, path_depths)
-            
-        return path_depths
-    
-    def _dfs_path_depth(
-        self,
-        task_id: str,
-        current_depth: int,
-        path_depths: Dict[str, int]
-    ) -> None:
-        """
-        Recursively calculate path depths using depth-first search.
-        
-        Args:
-            task_id: Current task ID
-            current_depth: Current path depth
-            path_depths: Dictionary to store maximum path depths
-        """
-        # Update maximum path depth for this task
-        path_depths[task_id] = max(path_depths.get(task_id, 0), current_depth)
-        
-        # Process all dependent tasks
-        for dependent_id in self.task_graph.get_dependents(task_id):
-            self._dfs_path_depth(dependent_id, current_depth + 1, path_depths)
+        # A task's longest path from any root is exactly its level in
+        # the Kahn level-by-level ordering, so the per-edge relaxation
+        # loop collapses to enumerating the levels the graph already
+        # computes in one pass
+        try:
+            levels = self.task_graph.topological_levels()
+        except Exception as e:
+            logger.warning(f"Failed to calculate path depths: {e}")
+            return {}
+
+        return {
+            task.id: depth
+            for depth, level in enumerate(levels)
+            for task in level
+        }
     
     def identify_bottlenecks(self, threshold: int = 3) -> List[Dict[str, Any]]:
         """
@@ -250,49 +469,42 @@ class TaskScheduler:
             List of bottleneck tasks with details about why they're bottlenecks
         """
         bottlenecks = []
-        
-        # Try to calculate the critical path
-        try:
-            critical_path = self.task_graph.calculate_critical_path()
-            critical_path_ids = {task.id for task in critical_path}
-        except Exception as e:
-            logger.warning(f"Failed to calculate critical path: {e}")
-            critical_path_ids = set()
+
+        # Critical-path membership comes from the version-keyed cache
+        critical_path_ids, _ = self._cached_structural_analysis()
         
         for task_id, task in self.task_graph.tasks.items():
             # Skip completed tasks
             if task.status == TaskStatus.COMPLETED:
                 continue
                 
-            dependents = self.task_graph.get_all_dependents(task_id)
+            # One closure-cache lookup and one len() per task; the
+            # count feeds all three criteria and the sort key
+            dependent_count = len(self.task_graph.get_all_dependents(task_id))
             
-            is_bottleneck = False
             reasons = []
             
             # Criterion 1: Task has many dependents
-            if len(dependents) >= threshold:
-                is_bottleneck = True
-                reasons.append(f"Blocks {len(dependents)} other tasks")
+            if dependent_count >= threshold:
+                reasons.append(f"Blocks {dependent_count} other tasks")
             
             # Criterion 2: Task is on the critical path
             if task_id in critical_path_ids:
-                is_bottleneck = True
                 reasons.append("On the critical path")
             
             # Criterion 3: Task is blocked and has dependents
-            if task.status == TaskStatus.BLOCKED and dependents:
-                is_bottleneck = True
-                reasons.append(f"Currently blocked and has {len(dependents)} dependent tasks")
+            if task.status == TaskStatus.BLOCKED and dependent_count:
+                reasons.append(f"Currently blocked and has {dependent_count} dependent tasks")
             
-            if is_bottleneck:
+            if reasons:
                 bottlenecks.append({
                     "task": task,
-                    "dependents_count": len(dependents),
+                    "dependents_count": dependent_count,
                     "reasons": reasons
                 })
         
         # Sort bottlenecks by number of dependents (descending)
-        bottlenecks.sort(key=lambda x: x["dependents_count"], reverse=True)
+        bottlenecks.sort(key=itemgetter("dependents_count"), reverse=True)
         
         return bottlenecks
     
@@ -317,58 +529,77 @@ class TaskScheduler:
         # Calculate effective priorities
         self.calculate_effective_priorities()
         
-        # Track unscheduled tasks
-        unscheduled = set(self.task_graph.tasks.keys())
+        # Countdown of tasks still to schedule; membership tests piggyback
+        # on the schedule dict built below, so no separate set is kept
+        remaining = len(self.task_graph.tasks)
         
-        # Track when each resource becomes available
-        resource_available = [start_date] * resources
+        # Min-heap of (available_time, resource_idx): popping the
+        # earliest-free resource is O(log R) instead of a linear
+        # min-plus-index scan per scheduled task
+        resource_heap = [(start_date, idx) for idx in range(resources)]
+        heapq.heapify(resource_heap)
         
         # Store task schedules
         schedule = {}
         
-        # Track tasks that are ready to be scheduled
+        # Track tasks that are ready to be scheduled. Heap entries are
+        # (-priority, sequence, task): the sequence number breaks
+        # priority ties so comparisons never fall through to the task,
+        # and carrying the task itself saves a dict lookup per pop
         ready_tasks = []
+        push_sequence = 0
+
+        # Earliest start permitted by each task's scheduled dependencies,
+        # pushed forward as those dependencies finish; this replaces a
+        # per-task rescan of all dependency end times
+        earliest_after_deps = defaultdict(lambda: start_date)
+
+        # Kahn-style countdown of unscheduled dependencies per task; a
+        # dependent enqueues the moment its counter reaches zero instead
+        # of rescanning its whole dependency list on every trigger
+        remaining_deps = {
+            tid: len(task.dependencies)
+            for tid, task in self.task_graph.tasks.items()
+        }
         
         # Initial ready tasks are those with no dependencies
         for task in self.task_graph.get_root_tasks():
             if task.status != TaskStatus.COMPLETED:
                 # Use negative priority for min-heap (highest priority first)
-                heapq.heappush(ready_tasks, (-task.effective_priority, task.id))
+                heapq.heappush(
+                    ready_tasks, (-task.effective_priority, push_sequence, task)
+                )
+                push_sequence += 1
                 
         # Schedule tasks until all are scheduled
-        while unscheduled:
+        while remaining:
             # If no tasks are ready, there might be a dependency cycle
             if not ready_tasks:
-                remaining = [self.task_graph.tasks[tid] for tid in unscheduled]
-                logger.warning(f"Unable to schedule {len(remaining)} tasks due to dependencies")
+                logger.warning(f"Unable to schedule {remaining} tasks due to dependencies")
                 break
             
             # Get highest priority ready task
-            _, task_id = heapq.heappop(ready_tasks)
+            _, _, task = heapq.heappop(ready_tasks)
+            task_id = task.id
             
             # Skip if already scheduled
-            if task_id not in unscheduled:
+            if task_id in schedule:
                 continue
-                
-            task = self.task_graph.tasks[task_id]
             
             # Find earliest available resource
-            resource_idx = resource_available.index(min(resource_available))
-            start_time = resource_available[resource_idx]
+            start_time, resource_idx = heapq.heappop(resource_heap)
             
             # Adjust start time based on dependencies
-            for dep_id in task.dependencies:
-                if dep_id in schedule:
-                    dep_end = schedule[dep_id]["end_time"]
-                    if dep_end > start_time:
-                        start_time = dep_end
+            dep_ready = earliest_after_deps[task_id]
+            if dep_ready > start_time:
+                start_time = dep_ready
             
             # Calculate end time
             hours_needed = task.estimated_effort  # Assuming effort is in hours
             end_time = start_time + timedelta(hours=hours_needed)
             
             # Update resource availability
-            resource_available[resource_idx] = end_time
+            heapq.heappush(resource_heap, (end_time, resource_idx))
             
             # Add to schedule
             schedule[task_id] = {
@@ -379,25 +610,25 @@ class TaskScheduler:
             }
             
             # Mark as scheduled
-            unscheduled.remove(task_id)
+            remaining -= 1
             
             # Add dependent tasks to ready list if all their dependencies are scheduled
             for dependent_id in self.task_graph.get_dependents(task_id):
-                if dependent_id in unscheduled:
-                    dependent_task = self.task_graph.tasks[dependent_id]
-                    
-                    # Check if all dependencies are scheduled
-                    all_deps_scheduled = True
-                    for dep_id in dependent_task.dependencies:
-                        if dep_id in unscheduled:
-                            all_deps_scheduled = False
-                            break
-                            
-                    if all_deps_scheduled:
+                if dependent_id not in schedule:
+                    # This task's end time pushes the dependent's earliest start
+                    if end_time > earliest_after_deps[dependent_id]:
+                        earliest_after_deps[dependent_id] = end_time
+
+                    # Enqueue once the last dependency is scheduled
+                    remaining_deps[dependent_id] -= 1
+                    if remaining_deps[dependent_id] == 0:
+                        dependent_task = self.task_graph.tasks[dependent_id]
                         heapq.heappush(
                             ready_tasks,
-                            (-dependent_task.effective_priority, dependent_id)
+                            (-dependent_task.effective_priority, push_sequence,
+                             dependent_task)
                         )
+                        push_sequence += 1
         
         # Calculate project metrics
         if schedule:
@@ -415,7 +646,7 @@ class TaskScheduler:
             "project_end": project_end,
             "project_duration": project_duration,
             "resources_used": resources,
-            "unscheduled_tasks": len(unscheduled)
+            "unscheduled_tasks": remaining
         }
     
     def get_paths_to_completion(self, task_id: str) -> List[List[str]]:
@@ -431,41 +662,52 @@ class TaskScheduler:
         if task_id not in self.task_graph.tasks:
             return []
             
-        paths = []
-        self._find_paths_to_task(task_id, [], set(), paths)
-        return paths
+        return self._find_paths_to_task(task_id)
     
-    def _find_paths_to_task(
-        self,
-        target_id: str,
-        current_path: List[str],
-        visited: Set[str],
-        all_paths: List[List[str]]
-    ) -> None:
+    def _find_paths_to_task(self, target_id: str) -> List[List[str]]:
         """
-        Recursively find all paths to a target task.
-        
+        Find all root-to-target paths with an explicit stack.
+
+        Paths are assembled bottom-up and the sub-paths reaching each
+        node are memoized, so shared sub-graphs (diamonds) are walked
+        once instead of once per path through them, and no per-branch
+        path/visited copies are made.
+
         Args:
             target_id: Target task ID
-            current_path: Current path being built
-            visited: Set of visited task IDs (to avoid cycles)
-            all_paths: List to collect all found paths
+
+        Returns:
+            List of paths (each path is a list of task IDs, root first)
         """
-        if target_id in visited:
-            return
-            
-        current_path.append(target_id)
-        visited.add(target_id)
-        
-        # If this is a root task (no dependencies), we've found a path
-        deps = self.task_graph.get_dependencies(target_id)
-        if not deps:
-            # Reverse the path to get it in order from root to target
-            all_paths.append(list(reversed(current_path)))
-        else:
-            # Continue searching through dependencies
-            for dep_id in deps:
-                self._find_paths_to_task(dep_id, current_path.copy(), visited.copy(), all_paths)
+        # Paths from any root to each node, as tuples so they can be
+        # shared between the paths that extend them
+        subpaths: Dict[str, List[Tuple[str, ...]]] = {}
+
+        # Post-order traversal: a node is expanded once its dependencies
+        # all have their sub-paths computed
+        stack: List[Tuple[str, bool]] = [(target_id, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in subpaths:
+                continue
+
+            deps = self.task_graph.get_dependencies(node)
+            if not expanded:
+                stack.append((node, True))
+                for dep_id in deps:
+                    if dep_id not in subpaths:
+                        stack.append((dep_id, False))
+            elif not deps:
+                # Root task: the path starts here
+                subpaths[node] = [(node,)]
+            else:
+                subpaths[node] = [
+                    path + (node,)
+                    for dep_id in deps
+                    for path in subpaths[dep_id]
+                ]
+
+        return [list(path) for path in subpaths[target_id]]
     
     def estimate_completion_date(self, task_id: str) -> Optional[datetime]:
         """
@@ -477,9 +719,16 @@ class TaskScheduler:
         Returns:
             Estimated completion date or None if not estimable
         """
-        # Generate a schedule starting from now
-        schedule = self.generate_schedule()
-        
+        # Reuse the last schedule while the graph is unchanged; repeated
+        # completion-date queries then cost one dict lookup instead of a
+        # full scheduling run
+        version = self.task_graph._version
+        cached = self._schedule_cache
+        if cached is None or cached[0] != version:
+            cached = (version, self.generate_schedule())
+            self._schedule_cache = cached
+        schedule = cached[1]
+
         # Return the end time for this task if scheduled
         if task_id in schedule["schedule"]:
             return schedule["schedule"][task_id]["end_time"]
@@ -2,12 +2,12 @@
 Task module for representing individual tasks with their properties and relationships.
 """
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Set
 
 
-class TaskStatus(Enum):
+class TaskStatus(IntEnum):
     """Status of a task in its lifecycle."""
     NOT_STARTED = auto()
     IN_PROGRESS = auto()
@@ -16,7 +16,7 @@ class TaskStatus(Enum):
     CANCELLED = auto()
 
 
-class Priority(Enum):
+class Priority(IntEnum):
     """Priority levels for tasks."""
     LOW = 1
     MEDIUM = 2
@@ -42,6 +42,15 @@ class Task:
         tags: List of tags for categorization
         metadata: Additional task-specific data
     """
+
+    # Fixed attribute layout: drops the per-instance __dict__, which
+    # shrinks each task and makes attribute reads in the scheduler's hot
+    # loops a C array offset instead of a dict lookup
+    __slots__ = (
+        "id", "title", "description", "status", "_priority",
+        "priority_value", "estimated_effort", "dependencies", "dependents",
+        "tags", "metadata", "created_at", "updated_at", "_effective_priority",
+    )
     
     def __init__(
         self,
@@ -73,7 +82,7 @@ class Task:
         self.title = title
         self.description = description
         self.status = status
-        self.priority = priority
+        self.priority = priority  # Also caches priority_value via the setter
         self.estimated_effort = estimated_effort
         self.dependencies = dependencies or set()
         self.dependents = set()  # Will be populated by the TaskGraph
@@ -85,6 +94,23 @@ class Task:
         # Dynamic priority calculated based on dependencies
         self._effective_priority = None
         
+    @property
+    def priority(self) -> Priority:
+        """Base priority level of the task."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: Priority) -> None:
+        """
+        Set the base priority, caching its numeric value.
+
+        The float value is read per task in the scheduler's hot loops,
+        so it is cached here instead of dereferencing the enum member
+        each time.
+        """
+        self._priority = priority
+        self.priority_value = float(priority.value)
+
     def update_status(self, status: TaskStatus) -> None:
         """
         Update the status of the task.
@@ -157,7 +183,7 @@ class Task:
         """
         if self._effective_priority is not None:
             return self._effective_priority
-        return self.priority.value
+        return self.priority_value
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+import os
+import sys
+
+# Make the repository root importable exactly once per session instead
+# of every test module inserting (and duplicating) it at import time
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -1,20 +1,71 @@
 """
 Tests for the base agent.
 """
-import os
+import copy
 import tempfile
 import shutil
 import pytest
 from unittest.mock import MagicMock, patch
 
-# Add parent directory to path for importing
-import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 import dspy
 from autodev.agent.base import BaseAgent
 
 
+def _mock_generate(prompt, **kwargs):
+    """Return a canned response keyed on the prompt contents."""
+    if "code" in prompt.lower():
+        return "def hello(): return 'Hello, world!'"
+    elif "explain" in prompt.lower():
+        return "This function returns a greeting."
+    elif "test" in prompt.lower():
+        return "def test_hello(): assert hello() == 'Hello, world!'"
+    elif "document" in prompt.lower():
+        return "# Hello Function\nReturns a greeting."
+    else:
+        return "I'm a helpful assistant."
+
+
+def _mock_prediction(**kwargs):
+    """Build the canned prediction returned by the mocked Predict modules."""
+    return MagicMock(
+        response="Mock response",
+        code="def mock(): pass",
+        explanation="Mock explanation",
+        tests="def test_mock(): pass",
+        documentation="Mock documentation"
+    )
+
+
+@pytest.fixture(scope="class")
+def predict_patch():
+    """
+    Patch dspy.Predict once for the whole test class.
+
+    Entering a patch saves and restores module attributes each time, so
+    the class shares a single activation. Tests asserting call counts
+    reset the mock before constructing their own agent.
+    """
+    patcher = patch('dspy.Predict')
+    mock_predict = patcher.start()
+    # Configure the mock Predict to return predictable responses
+    mock_predict.return_value.side_effect = _mock_prediction
+    yield mock_predict
+    patcher.stop()
+
+
+@pytest.fixture(scope="class")
+def agent_template(predict_patch):
+    """
+    Build the patched BaseAgent once per test class.
+
+    Constructing the agent creates five dspy.Predict modules, so the
+    expensive setup runs once and each test gets a shallow copy.
+    """
+    mock_lm = MagicMock()
+    mock_lm.generate.side_effect = _mock_generate
+    return BaseAgent(lm=mock_lm, project_id="test_project")
+
+
 class TestBaseAgent:
     """Test suite for the BaseAgent class."""
     
@@ -23,20 +74,9 @@ class TestBaseAgent:
         """Create a mock language model."""
         mock_lm = MagicMock()
         
-        # Configure mock to return predictable responses
-        def mock_generate(prompt, **kwargs):
-            if "code" in prompt.lower():
-                return "def hello(): return 'Hello, world!'"
-            elif "explain" in prompt.lower():
-                return "This function returns a greeting."
-            elif "test" in prompt.lower():
-                return "def test_hello(): assert hello() == 'Hello, world!'"
-            elif "document" in prompt.lower():
-                return "# Hello Function\nReturns a greeting."
-            else:
-                return "I'm a helpful assistant."
-        
-        mock_lm.generate.side_effect = mock_generate
+        # Configure mock to return predictable responses; the response
+        # function is shared at module level instead of rebuilt per test
+        mock_lm.generate.side_effect = _mock_generate
         
         return mock_lm
     
@@ -48,40 +88,31 @@ class TestBaseAgent:
         shutil.rmtree(temp_dir)
     
     @pytest.fixture
-    def agent(self, mock_lm):
-        """Create a BaseAgent instance with mock LM for testing."""
-        with patch('dspy.Predict') as mock_predict:
-            # Configure the mock Predict to return predictable responses
-            mock_predict.return_value.side_effect = lambda **kwargs: MagicMock(
-                response="Mock response",
-                code="def mock(): pass",
-                explanation="Mock explanation",
-                tests="def test_mock(): pass",
-                documentation="Mock documentation"
-            )
-            
-            agent = BaseAgent(lm=mock_lm, project_id="test_project")
-            
-            return agent
+    def agent(self, agent_template):
+        """Create a per-test BaseAgent clone of the shared template."""
+        # A shallow copy keeps the mocked Predict modules (stateless,
+        # constant responses) while isolating attribute changes like
+        # set_language_model to the individual test
+        return copy.copy(agent_template)
     
-    def test_initialization(self, mock_lm):
+    def test_initialization(self, mock_lm, predict_patch):
         """Test that BaseAgent initializes correctly."""
-        with patch('dspy.Predict') as mock_predict:
-            agent = BaseAgent(lm=mock_lm, project_id="test_project")
-            
-            assert agent.lm is mock_lm
-            assert agent.memory_manager is not None
-            assert mock_predict.call_count == 5  # One for each module
+        predict_patch.reset_mock()
+        agent = BaseAgent(lm=mock_lm, project_id="test_project")
+        
+        assert agent.lm is mock_lm
+        assert agent.memory_manager is not None
+        assert predict_patch.call_count == 5  # One for each module
     
-    def test_set_language_model(self, agent, mock_lm):
+    def test_set_language_model(self, agent, predict_patch):
         """Test setting the language model."""
         new_mock_lm = MagicMock()
         
-        with patch('dspy.Predict') as mock_predict:
-            agent.set_language_model(new_mock_lm)
-            
-            assert agent.lm is new_mock_lm
-            assert mock_predict.call_count == 5  # One for each module
+        predict_patch.reset_mock()
+        agent.set_language_model(new_mock_lm)
+        
+        assert agent.lm is new_mock_lm
+        assert predict_patch.call_count == 5  # One for each module
     
     def test_set_project(self, agent):
         """Test setting the project."""
@@ -136,21 +167,16 @@ class TestBaseAgent:
             assert documentation == "Mock documentation"
             assert mock_add_context.call_count == 2  # code, documentation
     
-    def test_error_when_lm_not_set(self):
+    @pytest.mark.parametrize("method,args", [
+        ("answer_query", ("How do I define a function?",)),
+        ("generate_code", ("Write a function",)),
+        ("explain_code", ("def hello(): pass",)),
+        ("generate_tests", ("def hello(): pass",)),
+        ("generate_documentation", ("def hello(): pass",)),
+    ])
+    def test_error_when_lm_not_set(self, method, args):
         """Test that methods raise errors when LM is not set."""
         agent = BaseAgent()  # No LM provided
         
         with pytest.raises(ValueError, match="Language model not set"):
-            agent.answer_query("How do I define a function?")
-        
-        with pytest.raises(ValueError, match="Language model not set"):
-            agent.generate_code("Write a function")
-        
-        with pytest.raises(ValueError, match="Language model not set"):
-            agent.explain_code("def hello(): pass")
-        
-        with pytest.raises(ValueError, match="Language model not set"):
-            agent.generate_tests("def hello(): pass")
-        
-        with pytest.raises(ValueError, match="Language model not set"):
-            agent.generate_documentation("def hello(): pass")
+            getattr(agent, method)(*args)
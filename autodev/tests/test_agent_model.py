@@ -2,15 +2,10 @@
 Tests for the model configuration module.
 """
 import os
-import tempfile
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
-# Add parent directory to path for importing
-import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 import dspy
 from autodev.agent.model import (
     get_api_key,
@@ -19,6 +14,12 @@ from autodev.agent.model import (
     setup_openai_model
 )
 
+# Spec'd mocks introspect the target class at construction time, which
+# dominates their cost; build the LM stand-in once at import. The setup
+# tests only check identity on it and never assert calls, so sharing
+# one instance is safe.
+_LM_SPEC_MOCK = MagicMock(spec=dspy.LM)
+
 
 class TestModelConfiguration:
     """Test suite for the model configuration module."""
@@ -53,15 +54,14 @@ class TestModelConfiguration:
         
         assert key is None
     
-    def test_save_and_get_api_key(self, mock_env):
+    def test_save_and_get_api_key(self, mock_env, tmp_path):
         """Test saving and then getting an API key."""
         with patch('pathlib.Path.home') as mock_home:
-            # Set up temporary directory
-            temp_dir = tempfile.mkdtemp()
-            mock_home.return_value = Path(temp_dir)
+            # pytest manages the temporary home directory
+            mock_home.return_value = tmp_path
             
             # Ensure .autodev directory exists
-            autodev_dir = Path(temp_dir) / ".autodev"
+            autodev_dir = tmp_path / ".autodev"
             autodev_dir.mkdir(exist_ok=True)
             
             # Save API key
@@ -82,10 +82,10 @@ class TestModelConfiguration:
                 key = get_api_key("TEST_API_KEY")
                 assert key == "test_key_value"
     
-    def test_setup_openrouter_model(self, mock_env):
+    def test_setup_openrouter_model(self, mock_env, tmp_path):
         """Test setting up an OpenRouter model."""
         with patch('dspy.Mistral') as mock_mistral:
-            mock_lm = MagicMock(spec=dspy.LM)
+            mock_lm = _LM_SPEC_MOCK
             mock_mistral.return_value = mock_lm
             
             # Test with explicit API key
@@ -96,11 +96,10 @@ class TestModelConfiguration:
             
             # Check API key was saved
             with patch('pathlib.Path.home') as mock_home:
-                temp_dir = tempfile.mkdtemp()
-                mock_home.return_value = Path(temp_dir)
+                mock_home.return_value = tmp_path
                 
                 # Create directory
-                autodev_dir = Path(temp_dir) / ".autodev"
+                autodev_dir = tmp_path / ".autodev"
                 autodev_dir.mkdir(exist_ok=True)
                 
                 # Call function again
@@ -118,10 +117,10 @@ class TestModelConfiguration:
             with pytest.raises(ValueError, match="OpenRouter API key not provided"):
                 setup_openrouter_model()
     
-    def test_setup_openai_model(self, mock_env):
+    def test_setup_openai_model(self, mock_env, tmp_path):
         """Test setting up an OpenAI model."""
         with patch('dspy.OpenAI') as mock_openai:
-            mock_lm = MagicMock(spec=dspy.LM)
+            mock_lm = _LM_SPEC_MOCK
             mock_openai.return_value = mock_lm
             
             # Test with explicit API key
@@ -132,11 +131,10 @@ class TestModelConfiguration:
             
             # Check API key was saved
             with patch('pathlib.Path.home') as mock_home:
-                temp_dir = tempfile.mkdtemp()
-                mock_home.return_value = Path(temp_dir)
+                mock_home.return_value = tmp_path
                 
                 # Create directory
-                autodev_dir = Path(temp_dir) / ".autodev"
+                autodev_dir = tmp_path / ".autodev"
                 autodev_dir.mkdir(exist_ok=True)
                 
                 # Call function again
@@ -1,15 +1,13 @@
 """
 Tests for the CLI module.
 """
-import os
+import argparse
 import sys
 import tempfile
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, mock_open
 
-# Add parent directory to path for importing
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from autodev.cli import (
     setup_argparse,
     setup_model,
@@ -25,27 +23,47 @@ from autodev.cli import (
 )
 
 
+@pytest.fixture(scope="session")
+def parser():
+    """Build the CLI argument parser once for the whole session."""
+    return setup_argparse()
+
+
 class TestCLI:
     """Test suite for the CLI module."""
     
-    def test_setup_argparse(self):
+    @pytest.fixture
+    def read_file_mock(self):
+        """Patch autodev.cli.read_file with canned file contents."""
+        with patch('autodev.cli.read_file') as mock_read:
+            mock_read.return_value = "def test(): pass"
+            yield mock_read
+    
+    @pytest.fixture
+    def write_file_mock(self):
+        """Patch autodev.cli.write_file for output-file assertions."""
+        with patch('autodev.cli.write_file') as mock_write:
+            yield mock_write
+    
+    def test_setup_argparse(self, parser):
         """Test setting up the argument parser."""
-        parser = setup_argparse()
-        
         # Test that parser has expected commands
-        commands = [
+        commands = {
             "config",
             "generate",
             "explain",
             "test",
             "document",
             "query"
-        ]
+        }
         
-        # Parse each command with --help to ensure they're defined
-        for command in commands:
-            with pytest.raises(SystemExit):
-                parser.parse_args([command, "--help"])
+        # Inspect the subparsers directly: parsing "--help" per command
+        # would print to stdout and raise SystemExit for each one
+        subparsers = next(
+            action for action in parser._actions
+            if isinstance(action, argparse._SubParsersAction)
+        )
+        assert commands.issubset(subparsers.choices)
     
     def test_setup_model_openrouter(self):
         """Test setting up an OpenRouter model."""
@@ -131,208 +149,87 @@ class TestCLI:
             with pytest.raises(SystemExit):
                 handle_config(args)
     
-    def test_handle_generate(self):
-        """Test handling the generate command."""
+    @pytest.mark.parametrize(
+        "handler,method,return_value,arg_fields,expected_call,expected_output",
+        [
+            pytest.param(
+                handle_generate, "generate_code",
+                {"code": "def test(): pass",
+                 "explanation": "This is a test function."},
+                {"task": "Write a test function", "constraints": "Must be simple"},
+                {"task": "Write a test function", "constraints": "Must be simple",
+                 "context": None},
+                "def test(): pass",
+                id="generate",
+            ),
+            pytest.param(
+                handle_explain, "explain_code",
+                "This is a test function.",
+                {"file": "test_file.py"},
+                {"code": "def test(): pass", "context": None},
+                "This is a test function.",
+                id="explain",
+            ),
+            pytest.param(
+                handle_test, "generate_tests",
+                {"tests": "def test_function(): assert test() is None",
+                 "explanation": "This test verifies that the function returns None."},
+                {"file": "test_file.py"},
+                {"code": "def test(): pass", "context": None},
+                "def test_function(): assert test() is None",
+                id="test",
+            ),
+            pytest.param(
+                handle_document, "generate_documentation",
+                "# Test Function\nA simple test function.",
+                {"file": "test_file.py"},
+                {"code": "def test(): pass", "context": None},
+                "# Test Function\nA simple test function.",
+                id="document",
+            ),
+            pytest.param(
+                handle_query, "answer_query",
+                "To define a function in Python, use the def keyword.",
+                {"query": "How do I define a function in Python?"},
+                {"query": "How do I define a function in Python?", "context": None},
+                "To define a function in Python, use the def keyword.",
+                id="query",
+            ),
+        ]
+    )
+    def test_handle_command(self, read_file_mock, write_file_mock, handler,
+                            method, return_value, arg_fields, expected_call,
+                            expected_output):
+        """Test the command handlers with and without an output file."""
         # Mock agent
         mock_agent = MagicMock()
-        mock_agent.generate_code.return_value = {
-            "code": "def test(): pass",
-            "explanation": "This is a test function."
-        }
+        getattr(mock_agent, method).return_value = return_value
         
         # Args without output file
         args = MagicMock()
-        args.task = "Write a test function"
-        args.constraints = "Must be simple"
         args.context_file = None
         args.output_file = None
+        for name, value in arg_fields.items():
+            setattr(args, name, value)
         
         # Test without output file
         with patch('builtins.print') as mock_print:
-            handle_generate(args, mock_agent)
+            handler(args, mock_agent)
             
-            mock_agent.generate_code.assert_called_once_with(
-                task="Write a test function",
-                constraints="Must be simple",
-                context=None
-            )
+            if "file" in arg_fields:
+                read_file_mock.assert_called_once_with(arg_fields["file"])
+            getattr(mock_agent, method).assert_called_once_with(**expected_call)
             
             # Check that output was printed
             assert mock_print.call_count > 0
         
         # Args with output file
-        args.output_file = "test_output.py"
+        args.output_file = "test_output.txt"
         
         # Test with output file
-        with patch('autodev.cli.write_file') as mock_write:
-            handle_generate(args, mock_agent)
-            
-            mock_write.assert_called_once_with("test_output.py", "def test(): pass")
-    
-    def test_handle_explain(self):
-        """Test handling the explain command."""
-        # Mock agent
-        mock_agent = MagicMock()
-        mock_agent.explain_code.return_value = "This is a test function."
-        
-        # Args without output file
-        args = MagicMock()
-        args.file = "test_file.py"
-        args.context_file = None
-        args.output_file = None
+        handler(args, mock_agent)
         
-        # Test without output file
-        with patch('autodev.cli.read_file') as mock_read:
-            mock_read.return_value = "def test(): pass"
-            
-            with patch('builtins.print') as mock_print:
-                handle_explain(args, mock_agent)
-                
-                mock_read.assert_called_once_with("test_file.py")
-                mock_agent.explain_code.assert_called_once_with(
-                    code="def test(): pass",
-                    context=None
-                )
-                
-                # Check that output was printed
-                assert mock_print.call_count > 0
-        
-        # Args with output file
-        args.output_file = "test_output.md"
-        
-        # Test with output file
-        with patch('autodev.cli.read_file') as mock_read:
-            mock_read.return_value = "def test(): pass"
-            
-            with patch('autodev.cli.write_file') as mock_write:
-                handle_explain(args, mock_agent)
-                
-                mock_write.assert_called_once_with("test_output.md", "This is a test function.")
-    
-    def test_handle_test(self):
-        """Test handling the test command."""
-        # Mock agent
-        mock_agent = MagicMock()
-        mock_agent.generate_tests.return_value = {
-            "tests": "def test_function(): assert test() is None",
-            "explanation": "This test verifies that the function returns None."
-        }
-        
-        # Args without output file
-        args = MagicMock()
-        args.file = "test_file.py"
-        args.context_file = None
-        args.output_file = None
-        
-        # Test without output file
-        with patch('autodev.cli.read_file') as mock_read:
-            mock_read.return_value = "def test(): pass"
-            
-            with patch('builtins.print') as mock_print:
-                handle_test(args, mock_agent)
-                
-                mock_read.assert_called_once_with("test_file.py")
-                mock_agent.generate_tests.assert_called_once_with(
-                    code="def test(): pass",
-                    context=None
-                )
-                
-                # Check that output was printed
-                assert mock_print.call_count > 0
-        
-        # Args with output file
-        args.output_file = "test_output.py"
-        
-        # Test with output file
-        with patch('autodev.cli.read_file') as mock_read:
-            mock_read.return_value = "def test(): pass"
-            
-            with patch('autodev.cli.write_file') as mock_write:
-                handle_test(args, mock_agent)
-                
-                mock_write.assert_called_once_with(
-                    "test_output.py", 
-                    "def test_function(): assert test() is None"
-                )
-    
-    def test_handle_document(self):
-        """Test handling the document command."""
-        # Mock agent
-        mock_agent = MagicMock()
-        mock_agent.generate_documentation.return_value = "# Test Function\nA simple test function."
-        
-        # Args without output file
-        args = MagicMock()
-        args.file = "test_file.py"
-        args.context_file = None
-        args.output_file = None
-        
-        # Test without output file
-        with patch('autodev.cli.read_file') as mock_read:
-            mock_read.return_value = "def test(): pass"
-            
-            with patch('builtins.print') as mock_print:
-                handle_document(args, mock_agent)
-                
-                mock_read.assert_called_once_with("test_file.py")
-                mock_agent.generate_documentation.assert_called_once_with(
-                    code="def test(): pass",
-                    context=None
-                )
-                
-                # Check that output was printed
-                assert mock_print.call_count > 0
-        
-        # Args with output file
-        args.output_file = "test_output.md"
-        
-        # Test with output file
-        with patch('autodev.cli.read_file') as mock_read:
-            mock_read.return_value = "def test(): pass"
-            
-            with patch('autodev.cli.write_file') as mock_write:
-                handle_document(args, mock_agent)
-                
-                mock_write.assert_called_once_with(
-                    "test_output.md", 
-                    "# Test Function\nA simple test function."
-                )
-    
-    def test_handle_query(self):
-        """Test handling the query command."""
-        # Mock agent
-        mock_agent = MagicMock()
-        mock_agent.answer_query.return_value = "To define a function in Python, use the def keyword."
-        
-        # Args without output file
-        args = MagicMock()
-        args.query = "How do I define a function in Python?"
-        args.context_file = None
-        args.output_file = None
-        
-        # Test without output file
-        with patch('builtins.print') as mock_print:
-            handle_query(args, mock_agent)
-            
-            mock_agent.answer_query.assert_called_once_with(
-                query="How do I define a function in Python?",
-                context=None
-            )
-            
-            # Check that output was printed
-            assert mock_print.call_count > 0
-        
-        # Args with output file
-        args.output_file = "test_output.md"
-        
-        # Test with output file
-        with patch('autodev.cli.write_file') as mock_write:
-            handle_query(args, mock_agent)
-            
-            mock_write.assert_called_once_with(
-                "test_output.md", 
-                "To define a function in Python, use the def keyword."
-            )
+        write_file_mock.assert_called_once_with("test_output.txt", expected_output)
     
     def test_main_no_command(self):
         """Test main with no command."""
@@ -340,9 +237,9 @@ class TestCLI:
             mock_parser = MagicMock()
             mock_setup.return_value = mock_parser
             
-            # Create args with no command
-            mock_args = MagicMock()
-            mock_args.command = None
+            # Create args with no command; a plain namespace suffices
+            # since main only reads static fields from it
+            mock_args = SimpleNamespace(command=None)
             mock_parser.parse_args.return_value = mock_args
             
             # Call main and check that help is printed
@@ -359,8 +256,7 @@ class TestCLI:
             mock_setup.return_value = mock_parser
             
             # Create args with config command
-            mock_args = MagicMock()
-            mock_args.command = "config"
+            mock_args = SimpleNamespace(command="config")
             mock_parser.parse_args.return_value = mock_args
             
             # Call main and check that handle_config is called
@@ -378,8 +274,7 @@ class TestCLI:
             mock_setup.return_value = mock_parser
             
             # Create args with generate command
-            mock_args = MagicMock()
-            mock_args.command = "generate"
+            mock_args = SimpleNamespace(command="generate")
             mock_parser.parse_args.return_value = mock_args
             
             # Mock setup_model
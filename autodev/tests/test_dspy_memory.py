@@ -9,10 +9,6 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path for importing
-import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 import dspy
 from autodev.memory.dspy_memory import MemoryModule, ContextMemory, ProjectMemory, MemoryManager
 
@@ -8,10 +8,6 @@ import shutil
 import pytest
 from pathlib import Path
 
-# Add parent directory to path for importing
-import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from autodev.memory.base import BaseMemory
 
 